@@ -1,13 +1,15 @@
 """
 OnGoal REST API Endpoints - HTTP endpoints for conversation management
 """
+import time
 from datetime import datetime
-from typing import List, Optional
-from fastapi import APIRouter, HTTPException
+from typing import Any, Dict, List, Optional
+from fastapi import APIRouter, HTTPException, Response
 from pydantic import BaseModel
 
 from backend.models import Conversation, Goal, Message, GoalAlert
 from backend.repository import ConversationRepository
+from backend.responses import PydanticJSONResponse
 
 # Create router for API endpoints
 router = APIRouter()
@@ -15,6 +17,18 @@ router = APIRouter()
 # Singleton repository instance — shared across REST endpoints and WebSocket handlers
 conversation_repository = ConversationRepository()
 
+# Load balancers poll /api/health; serve the same body for a few seconds
+HEALTH_CACHE_SECONDS = 5.0
+_health_cache: Dict[str, Any] = {"generated_at": 0.0, "service_status": None, "body": b""}
+
+
+def _json_response(payload: Dict[str, Any]) -> PydanticJSONResponse:
+    """Build a JSON response from a dict whose values may be Pydantic models.
+
+    Returning the response directly skips FastAPI's jsonable_encoder pass.
+    """
+    return PydanticJSONResponse(payload)
+
 
 @router.get("/")
 async def root():
@@ -26,12 +40,18 @@ async def health_check():
     from backend.llm_provider import get_service_status
 
     service_status = get_service_status()
+    now = time.monotonic()
+    if (_health_cache["service_status"] is not service_status
+            or now - _health_cache["generated_at"] >= HEALTH_CACHE_SECONDS):
+        _health_cache["body"] = _json_response({
+            "status": "healthy" if service_status["available"] else "degraded",
+            "timestamp": datetime.now().isoformat(),
+            "llm_service": service_status
+        }).body
+        _health_cache["service_status"] = service_status
+        _health_cache["generated_at"] = now
 
-    return {
-        "status": "healthy" if service_status["available"] else "degraded",
-        "timestamp": datetime.now().isoformat(),
-        "llm_service": service_status
-    }
+    return Response(content=_health_cache["body"], media_type="application/json")
 
 
 @router.get("/api/llm-status")
@@ -61,13 +81,13 @@ async def reset_conversation(conversation_id: str):
 async def get_conversation(conversation_id: str):
     conversation = conversation_repository.get(conversation_id)
     if conversation:
-        return {
+        return _json_response({
             "id": conversation.id,
-            "messages": [msg.model_dump() for msg in conversation.messages],
-            "goals": [goal.model_dump() for goal in conversation.goals],
-            "alerts": [alert.model_dump() for alert in conversation.alerts],
-            "pipeline_settings": conversation.pipeline_settings.model_dump()
-        }
+            "messages": conversation.messages,
+            "goals": conversation.goals,
+            "alerts": conversation.alerts,
+            "pipeline_settings": conversation.pipeline_settings
+        })
 
     raise HTTPException(status_code=404, detail="Conversation not found")
 
@@ -79,10 +99,10 @@ async def get_alerts(conversation_id: str):
     if not conversation:
         raise HTTPException(status_code=404, detail="Conversation not found")
 
-    return {
-        "alerts": [alert.model_dump() for alert in conversation.alerts],
+    return _json_response({
+        "alerts": conversation.alerts,
         "count": len(conversation.alerts)
-    }
+    })
 
 
 @router.delete("/api/conversations/{conversation_id}/alerts")
@@ -142,11 +162,11 @@ async def inject_alert(conversation_id: str, req: AlertInjectRequest):
     )
     conversation.alerts.append(alert)
 
-    return {
+    return _json_response({
         "status": "success",
-        "alert": alert.model_dump(),
+        "alert": alert,
         "timestamp": datetime.now().isoformat()
-    }
+    })
 
 
 # Request/Response models for goal CRUD operations
@@ -168,22 +188,23 @@ async def create_goal(conversation_id: str, goal_request: GoalCreateRequest):
     """Create a new goal manually"""
     conversation = conversation_repository.get_or_create(conversation_id)
     goal_id = f"G{len(conversation.goals)}_manual"
+    timestamp = datetime.now().isoformat()
 
     new_goal = Goal(
         id=goal_id,
         text=goal_request.text,
         type=goal_request.type,
         source_message_id=goal_request.source_message_id,
-        created_at=datetime.now().isoformat()
+        created_at=timestamp
     )
 
-    conversation.goals.append(new_goal)
+    conversation.add_goal(new_goal)
 
-    return {
+    return _json_response({
         "status": "success",
-        "goal": new_goal.model_dump(),
-        "timestamp": datetime.now().isoformat()
-    }
+        "goal": new_goal,
+        "timestamp": timestamp
+    })
 
 @router.get("/api/conversations/{conversation_id}/goals")
 async def get_goals(conversation_id: str):
@@ -192,10 +213,10 @@ async def get_goals(conversation_id: str):
     if not conversation:
         raise HTTPException(status_code=404, detail="Conversation not found")
 
-    return {
-        "goals": [goal.model_dump() for goal in conversation.goals],
+    return _json_response({
+        "goals": conversation.goals,
         "count": len(conversation.goals)
-    }
+    })
 
 @router.get("/api/conversations/{conversation_id}/goals/{goal_id}")
 async def get_goal(conversation_id: str, goal_id: str):
@@ -204,11 +225,11 @@ async def get_goal(conversation_id: str, goal_id: str):
     if not conversation:
         raise HTTPException(status_code=404, detail="Conversation not found")
 
-    goal = next((g for g in conversation.goals if g.id == goal_id), None)
+    goal = conversation.get_goal_by_id(goal_id)
     if not goal:
         raise HTTPException(status_code=404, detail="Goal not found")
 
-    return {"goal": goal.model_dump()}
+    return _json_response({"goal": goal})
 
 @router.put("/api/conversations/{conversation_id}/goals/{goal_id}")
 async def update_goal(conversation_id: str, goal_id: str, goal_update: GoalUpdateRequest):
@@ -217,7 +238,7 @@ async def update_goal(conversation_id: str, goal_id: str, goal_update: GoalUpdat
     if not conversation:
         raise HTTPException(status_code=404, detail="Conversation not found")
 
-    goal = next((g for g in conversation.goals if g.id == goal_id), None)
+    goal = conversation.get_goal_by_id(goal_id)
     if not goal:
         raise HTTPException(status_code=404, detail="Goal not found")
 
@@ -233,11 +254,11 @@ async def update_goal(conversation_id: str, goal_id: str, goal_update: GoalUpdat
     if goal_update.status is not None:
         goal.status = goal_update.status
 
-    return {
+    return _json_response({
         "status": "success",
-        "goal": goal.model_dump(),
+        "goal": goal,
         "timestamp": datetime.now().isoformat()
-    }
+    })
 
 @router.delete("/api/conversations/{conversation_id}/goals/{goal_id}")
 async def delete_goal(conversation_id: str, goal_id: str):
@@ -246,18 +267,16 @@ async def delete_goal(conversation_id: str, goal_id: str):
     if not conversation:
         raise HTTPException(status_code=404, detail="Conversation not found")
 
-    goal_index = next((i for i, g in enumerate(conversation.goals) if g.id == goal_id), None)
-    if goal_index is None:
+    deleted_goal = conversation.remove_goal(goal_id)
+    if deleted_goal is None:
         raise HTTPException(status_code=404, detail="Goal not found")
 
-    deleted_goal = conversation.goals.pop(goal_index)
-
-    return {
+    return _json_response({
         "status": "success",
         "message": f"Goal {goal_id} deleted",
-        "deleted_goal": deleted_goal.model_dump(),
+        "deleted_goal": deleted_goal,
         "timestamp": datetime.now().isoformat()
-    }
+    })
 
 @router.post("/api/conversations/{conversation_id}/goals/{goal_id}/lock")
 async def lock_goal(conversation_id: str, goal_id: str):
@@ -266,18 +285,18 @@ async def lock_goal(conversation_id: str, goal_id: str):
     if not conversation:
         raise HTTPException(status_code=404, detail="Conversation not found")
 
-    goal = next((g for g in conversation.goals if g.id == goal_id), None)
+    goal = conversation.get_goal_by_id(goal_id)
     if not goal:
         raise HTTPException(status_code=404, detail="Goal not found")
 
     goal.locked = True
 
-    return {
+    return _json_response({
         "status": "success",
         "message": f"Goal {goal_id} locked",
-        "goal": goal.model_dump(),
+        "goal": goal,
         "timestamp": datetime.now().isoformat()
-    }
+    })
 
 @router.post("/api/conversations/{conversation_id}/goals/{goal_id}/unlock")
 async def unlock_goal(conversation_id: str, goal_id: str):
@@ -286,18 +305,18 @@ async def unlock_goal(conversation_id: str, goal_id: str):
     if not conversation:
         raise HTTPException(status_code=404, detail="Conversation not found")
 
-    goal = next((g for g in conversation.goals if g.id == goal_id), None)
+    goal = conversation.get_goal_by_id(goal_id)
     if not goal:
         raise HTTPException(status_code=404, detail="Goal not found")
 
     goal.locked = False
 
-    return {
+    return _json_response({
         "status": "success",
         "message": f"Goal {goal_id} unlocked",
-        "goal": goal.model_dump(),
+        "goal": goal,
         "timestamp": datetime.now().isoformat()
-    }
+    })
 
 @router.get("/api/conversations")
 async def list_conversations():
@@ -367,10 +386,10 @@ async def get_goal_history(conversation_id: str):
     if not conversation:
         raise HTTPException(status_code=404, detail="Conversation not found")
 
-    return {
-        "goal_history": [entry.model_dump() for entry in conversation.goal_history],
+    return _json_response({
+        "goal_history": conversation.goal_history,
         "turn_count": len([m for m in conversation.messages if m.role == "user"])
-    }
+    })
 
 
 @router.post("/api/conversations/{conversation_id}/goal-history/{entry_index}/restore")
@@ -399,12 +418,12 @@ async def restore_goal_from_history(conversation_id: str, entry_index: int):
         existing.type = entry.goal_type
         existing.created_at = entry.timestamp
     else:
-        conversation.goals.append(restored_goal)
+        conversation.add_goal(restored_goal)
 
-    return {
-        "goal": restored_goal.model_dump(),
+    return _json_response({
+        "goal": restored_goal,
         "message": f"Restored goal {entry.goal_id} from turn {entry.turn}"
-    }
+    })
 
 
 # Request/Response models for manual goal replacement
@@ -432,7 +451,7 @@ async def replace_goal(conversation_id: str, goal_id: str, req: GoalReplaceReque
     if not conversation:
         raise HTTPException(status_code=404, detail="Conversation not found")
 
-    goal = next((g for g in conversation.goals if g.id == goal_id), None)
+    goal = conversation.get_goal_by_id(goal_id)
     if not goal:
         raise HTTPException(status_code=404, detail="Goal not found")
 
@@ -440,27 +459,29 @@ async def replace_goal(conversation_id: str, goal_id: str, req: GoalReplaceReque
     goal.status = "replaced"
 
     # Create replacement goal
+    timestamp = datetime.now().isoformat()
     new_goal_id = f"{goal_id}R{len(conversation.goals)}"
     new_goal = Goal(
         id=new_goal_id,
         text=req.new_text,
         type=req.new_type,
         source_message_id="manual_replace",
-        created_at=datetime.now().isoformat(),
+        created_at=timestamp,
     )
-    conversation.goals.append(new_goal)
+    conversation.add_goal(new_goal)
 
     turn = len([m for m in conversation.messages if m.role == "user"])
     conversation.record_goal_history(
         turn=turn, operation="replace", goal_id=goal.id,
         goal_text=goal.text, goal_type=goal.type,
         previous_goal_ids=[new_goal.id], previous_goal_texts=[new_goal.text],
+        timestamp=timestamp,
     )
 
-    return {
+    return _json_response({
         "status": "success",
-        "old_goal": goal.model_dump(),
-        "new_goal": new_goal.model_dump(),
+        "old_goal": goal,
+        "new_goal": new_goal,
         "message": f"Replaced goal {goal_id} with {new_goal_id}",
-        "timestamp": datetime.now().isoformat()
-    }
+        "timestamp": timestamp
+    })
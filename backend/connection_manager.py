@@ -1,41 +1,72 @@
 """
 OnGoal Connection Manager - WebSocket connection management
 """
-import json
-from typing import List
+import asyncio
+from typing import List, Set
 from fastapi import WebSocket
+from pydantic_core import to_json
+
+
+def encode_message(message: dict) -> str:
+    """Serialize an outgoing message to a JSON text frame.
+
+    Uses pydantic-core's Rust encoder, which also accepts Pydantic models
+    nested anywhere in the message without a model_dump() round trip.
+    Frames stay text (not binary) because the frontend JSON.parse()s them.
+    """
+    return to_json(message).decode()
 
 
 class ConnectionManager:
     def __init__(self):
-        self.active_connections: List[WebSocket] = []
+        # A set keeps connect/disconnect O(1) under client churn
+        self.active_connections: Set[WebSocket] = set()
 
     async def connect(self, websocket: WebSocket):
         await websocket.accept()
-        self.active_connections.append(websocket)
+        self.active_connections.add(websocket)
 
     def disconnect(self, websocket: WebSocket):
-        try:
-            self.active_connections.remove(websocket)
-        except ValueError:
-            pass
+        self.active_connections.discard(websocket)
 
     async def send_message(self, message: dict, websocket: WebSocket) -> bool:
         """Send a message to a specific websocket. Returns True on success, False if the client disconnected."""
+        return await self.send_encoded(encode_message(message), websocket)
+
+    async def send_encoded(self, payload: str, websocket: WebSocket) -> bool:
+        """Send a frame already produced by encode_message(). Same return contract as send_message."""
         try:
-            await websocket.send_text(json.dumps(message))
+            await websocket.send_text(payload)
             return True
         except Exception:
             # Handle WebSocket connection errors gracefully
             # Remove disconnected websocket from active connections
-            if websocket in self.active_connections:
-                self.active_connections.remove(websocket)
+            self.disconnect(websocket)
             return False
 
     def get_connections(self) -> List[WebSocket]:
         """Return a copy of active connections for inspection."""
-        return self.active_connections.copy()
+        return list(self.active_connections)
 
     async def broadcast(self, message: dict):
-        for connection in self.active_connections:
-            await connection.send_text(json.dumps(message))
+        """Send a message to every connection concurrently.
+
+        One slow client no longer stalls the others. Connections whose send
+        fails are pruned in a single pass once all sends have settled.
+        """
+        # Serialize once and reuse the same frame for every connection
+        payload = encode_message(message)
+        # Snapshot so disconnects during the sends don't resize the set mid-iteration
+        recipients = tuple(self.active_connections)
+        results = await asyncio.gather(
+            *(self._send_frame(connection, payload) for connection in recipients),
+            return_exceptions=True,
+        )
+        self.active_connections.difference_update(
+            connection for connection, result in zip(recipients, results)
+            if isinstance(result, Exception)
+        )
+
+    @staticmethod
+    async def _send_frame(websocket: WebSocket, payload: str):
+        await websocket.send_text(payload)
@@ -4,16 +4,20 @@ Robust JSON extraction from LLM responses.
 Handles markdown code fences, nested braces, trailing text, and partial JSON.
 """
 
-import json
 import re
 from typing import Any, Optional
 
+from pydantic_core import from_json
+
+
+# Compiled once at import; runs on every LLM response
+_MARKDOWN_FENCE = re.compile(r'^\s*```(?:json)?\s*\n(.*?)\n?\s*```\s*$', re.DOTALL | re.IGNORECASE)
+
 
 # Private helper — not part of public API
 def _strip_markdown_fences(text: str) -> str:
     """Remove markdown ```json ... ``` fences if present."""
-    pattern = r'^\s*```(?:json)?\s*\n(.*?)\n?\s*```\s*$'
-    match = re.search(pattern, text, re.DOTALL | re.IGNORECASE)
+    match = _MARKDOWN_FENCE.search(text)
     if match:
         return match.group(1)
     return text
@@ -23,19 +27,36 @@ def _strip_markdown_fences(text: str) -> str:
 def _find_balanced_braces(text: str) -> Optional[str]:
     """Locate the outermost balanced `{ ... }` pair using brace counting.
 
+    Single linear pass starting at the first `{`. Braces inside JSON string
+    literals (including escaped quotes) are ignored, so values such as
+    "a } b" do not end the object early.
+
     Returns the substring from the first `{` to its matching `}`,
     or None if no balanced pair is found.
     """
+    start = text.find('{')
+    if start == -1:
+        return None
+
     depth = 0
-    start = -1
-    for idx, char in enumerate(text):
-        if char == '{':
-            if depth == 0:
-                start = idx
+    in_string = False
+    escaped = False
+    for idx in range(start, len(text)):
+        char = text[idx]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == '\\':
+                escaped = True
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif char == '{':
             depth += 1
         elif char == '}':
             depth -= 1
-            if depth == 0 and start != -1:
+            if depth == 0:
                 return text[start:idx + 1]
     return None
 
@@ -46,8 +67,8 @@ def extract_json_object(text: str) -> Optional[Any]:
     Strategy:
         1. Strip markdown code fences.
         2. Use brace counting to find the outermost balanced `{...}` pair.
-        3. Attempt json.loads — on success return the parsed object.
-        4. Fall back to regex search for the first `{`.
+        3. Parse with pydantic-core's Rust JSON parser — on success return the object.
+        4. Fall back to the span from the first `{` to the last `}`.
         5. Return None if nothing works.
     """
     if not text:
@@ -60,16 +81,18 @@ def extract_json_object(text: str) -> Optional[Any]:
     balanced = _find_balanced_braces(stripped)
     if balanced is not None:
         try:
-            return json.loads(balanced)
-        except json.JSONDecodeError:
+            return from_json(balanced)
+        except ValueError:
             pass
 
-    # Step 3: fallback regex search (first `{` to last `}`)
-    match = re.search(r'\{.*\}', text, re.DOTALL)
-    if match:
+    # Step 3: fallback span (first `{` to last `}`) — same slice as a greedy
+    # `\{.*\}` regex, but found with two linear scans and no backtracking
+    first_brace = text.find('{')
+    last_brace = text.rfind('}')
+    if first_brace != -1 and last_brace > first_brace:
         try:
-            return json.loads(match.group())
-        except json.JSONDecodeError:
+            return from_json(text[first_brace:last_brace + 1])
+        except ValueError:
             pass
 
     return None
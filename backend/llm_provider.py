@@ -26,6 +26,7 @@ Configuration via .env:
   ANTHROPIC_API_KEY, ANTHROPIC_MODEL
 """
 
+import asyncio
 import logging
 import os
 
@@ -50,6 +51,14 @@ PROVIDERS = {
 
 _active_provider: LLMProvider = None
 
+# Strong references to close tasks scheduled by reset_provider on a running loop
+_closing_tasks: set[asyncio.Task] = set()
+
+# Status dict for the provider it was built from; provider config is read from
+# the environment once at construction, so the status never changes after that
+_service_status: dict[str, object] = None
+_service_status_provider: LLMProvider = None
+
 
 def get_provider() -> LLMProvider:
     global _active_provider
@@ -64,9 +73,35 @@ def get_provider() -> LLMProvider:
     return _active_provider
 
 
+async def _close_quietly(provider: LLMProvider) -> None:
+    try:
+        await provider.aclose()
+    except Exception as exc:
+        logger.warning("Failed to close dropped LLM provider: %s", exc)
+
+
 def reset_provider():
+    """Drop the cached provider, closing its pooled connections."""
+    global _active_provider
+    provider, _active_provider = _active_provider, None
+    if provider is None:
+        return
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        asyncio.run(_close_quietly(provider))
+        return
+    task = loop.create_task(_close_quietly(provider))
+    _closing_tasks.add(task)
+    task.add_done_callback(_closing_tasks.discard)
+
+
+async def close_provider():
+    """Close the active provider's pooled connections and drop the cached instance."""
     global _active_provider
-    _active_provider = None
+    if _active_provider is not None:
+        await _active_provider.aclose()
+        _active_provider = None
 
 
 def is_available() -> bool:
@@ -83,7 +118,15 @@ async def generate_stream(messages: list[dict[str, str]], max_tokens: int = 2000
 
 
 def get_service_status() -> dict[str, object]:
+    """Return the active provider's status, built once per provider instance.
+
+    The returned dict is shared between callers and must not be mutated.
+    """
+    global _service_status, _service_status_provider
     provider = get_provider()
-    status = provider.get_status()
-    status["configured_provider"] = os.getenv("LLM_PROVIDER", "ollama")
-    return status
\ No newline at end of file
+    if _service_status_provider is not provider:
+        status = provider.get_status()
+        status["configured_provider"] = os.getenv("LLM_PROVIDER", "ollama")
+        _service_status = status
+        _service_status_provider = provider
+    return _service_status
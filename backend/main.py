@@ -3,6 +3,7 @@ OnGoal Backend - FastAPI server with WebSocket support for goal tracking
 """
 import logging
 import os
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, WebSocket
 from fastapi.middleware.cors import CORSMiddleware
 import uvicorn
@@ -11,6 +12,8 @@ from dotenv import load_dotenv
 from backend.connection_manager import ConnectionManager
 from backend.api_endpoints import router
 from backend.websocket_handlers import handle_websocket_connection
+from backend.llm_provider import close_provider
+from backend.responses import PydanticJSONResponse
 
 # Load environment variables
 load_dotenv()
@@ -23,8 +26,20 @@ logging.basicConfig(
     format="%(asctime)s [%(levelname)s] %(name)s: %(message)s"
 )
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    yield
+    # Release pooled LLM HTTP connections on shutdown
+    await close_provider()
+
+
 # Initialize FastAPI app
-app = FastAPI(title="OnGoal Backend", version="1.0.0")
+app = FastAPI(
+    title="OnGoal Backend",
+    version="1.0.0",
+    lifespan=lifespan,
+    default_response_class=PydanticJSONResponse,
+)
 
 # CORS middleware for Vue.js frontend
 # Include both localhost and 127.0.0.1 variants so browser tests that navigate
@@ -7,12 +7,20 @@ and prompt templates in 09-llm-prompts.md.
 
 from datetime import datetime
 from typing import List, Dict, Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
+
+# Domain models are mutated in place by the pipeline (goal.status = ...) and
+# nested into one another after they have been validated once. Pin the cheap
+# paths explicitly so a config change cannot silently add per-assignment or
+# per-nesting validation to those hot paths.
+DOMAIN_MODEL_CONFIG = ConfigDict(extra="ignore", validate_assignment=False, revalidate_instances="never")
 
 
 class GoalEvaluation(BaseModel):
     """Evaluation of how an assistant response addresses a goal (REQ-04-01-301–305)"""
 
+    model_config = DOMAIN_MODEL_CONFIG
+
     goal_id: str
     category: str  # confirm, contradict, ignore
     explanation: str = ""
@@ -33,6 +41,8 @@ class GoalEvaluation(BaseModel):
 class GoalAlert(BaseModel):
     """A detection alert for goal anomalies (REQ-03-01/02)"""
 
+    model_config = DOMAIN_MODEL_CONFIG
+
     alert_type: str  # forgetting, contradiction, derailment, repetition, breakdown
     severity: str = "warning"  # info, warning, critical
     goal_ids: List[str] = []
@@ -44,6 +54,8 @@ class GoalAlert(BaseModel):
 class Goal(BaseModel):
     """A conversational goal extracted from user dialogue (REQ-04-01-101–305)"""
 
+    model_config = DOMAIN_MODEL_CONFIG
+
     id: str
     text: str
     type: str  # question, request, offer, suggestion
@@ -57,26 +69,62 @@ class Goal(BaseModel):
 
 
 class Message(BaseModel):
-    """A single message in the conversation"""
+    """A single message in the conversation.
 
-    id: str
-    content: str
-    role: str  # user, assistant
-    timestamp: str = Field(default_factory=lambda: datetime.now().isoformat())
+    Messages are write-once: id, content, role and timestamp are frozen.
+    Only ``goals`` is filled in after creation, once inference has run.
+    """
+
+    model_config = DOMAIN_MODEL_CONFIG
+
+    id: str = Field(frozen=True)
+    content: str = Field(frozen=True)
+    role: str = Field(frozen=True)  # user, assistant
+    timestamp: str = Field(default_factory=lambda: datetime.now().isoformat(), frozen=True)
     goals: List[Goal] = []
 
 
 class PipelineSettings(BaseModel):
-    """Toggle settings for the goal pipeline stages"""
+    """Toggle settings for the goal pipeline stages.
+
+    Frozen so every Conversation can share one all-enabled default instance;
+    toggling a stage swaps in another shared instance via with_stage().
+    """
+
+    model_config = ConfigDict(frozen=True)
 
     infer: bool = True
     merge: bool = True
     evaluate: bool = True
 
+    def with_stage(self, stage: str, enabled: bool) -> "PipelineSettings":
+        """Return the settings with one stage toggled. Raises ValueError for unknown stages.
+
+        Instances are interned: there is at most one object per combination of
+        stage flags, however many conversations toggle stages.
+        """
+        if stage not in PipelineSettings.model_fields:
+            raise ValueError(f"Unknown pipeline stage: {stage}")
+        flags = self.model_dump()
+        flags[stage] = enabled
+        key = tuple(flags.values())
+        settings = _PIPELINE_SETTINGS_VARIANTS.get(key)
+        if settings is None:
+            settings = _PIPELINE_SETTINGS_VARIANTS[key] = PipelineSettings(**flags)
+        return settings
+
+
+DEFAULT_PIPELINE_SETTINGS = PipelineSettings()
+_PIPELINE_SETTINGS_VARIANTS: Dict[tuple, PipelineSettings] = {
+    tuple(DEFAULT_PIPELINE_SETTINGS.model_dump().values()): DEFAULT_PIPELINE_SETTINGS
+}
+
 
 class GoalHistoryEntry(BaseModel):
     """A record of a goal mutation for history/restore (REQ-04-02-205)"""
 
+    model_config = DOMAIN_MODEL_CONFIG
+
     turn: int
     operation: str  # keep, combine, replace, infer
     goal_id: str
@@ -90,26 +138,103 @@ class GoalHistoryEntry(BaseModel):
 class Conversation(BaseModel):
     """A conversation with tracked goals"""
 
+    model_config = DOMAIN_MODEL_CONFIG
+
     id: str
     messages: List[Message] = []
     goals: List[Goal] = []
     alerts: List[GoalAlert] = []
-    pipeline_settings: PipelineSettings = Field(default_factory=PipelineSettings)
+    pipeline_settings: PipelineSettings = DEFAULT_PIPELINE_SETTINGS
     goal_history: List[GoalHistoryEntry] = []
 
+    # id → list-position index over self.goals (first occurrence wins);
+    # rebuilt lazily whenever the list is reassigned or resized, and whenever a
+    # lookup misses or finds another goal at the indexed position after an
+    # in-place edit
+    _goal_positions: Dict[str, int] = PrivateAttr(default_factory=dict)
+    _indexed_goals: Optional[List[Goal]] = PrivateAttr(default=None)
+    _indexed_count: int = PrivateAttr(default=0)
+
+    # Append-only {"role", "content"} view of self.messages for LLM calls.
+    # Messages are write-once, so the view only ever grows at the end and its
+    # prefix stays identical turn to turn
+    _llm_view: List[Dict[str, str]] = PrivateAttr(default_factory=list)
+    _llm_view_source: Optional[List[Message]] = PrivateAttr(default=None)
+
+    def _goal_index(self, resync: bool = False) -> Dict[str, int]:
+        if resync or self._indexed_goals is not self.goals or self._indexed_count != len(self.goals):
+            index: Dict[str, int] = {}
+            for position, goal in enumerate(self.goals):
+                index.setdefault(goal.id, position)
+            self._goal_positions = index
+            self._indexed_goals = self.goals
+            self._indexed_count = len(self.goals)
+        return self._goal_positions
+
+    def _goal_position(self, goal_id: str) -> Optional[int]:
+        position = self._goal_index().get(goal_id)
+        if position is None or self.goals[position].id != goal_id:
+            position = self._goal_index(resync=True).get(goal_id)
+        return position
+
     def get_goal_by_id(self, goal_id: str) -> Optional[Goal]:
         """Find a goal by its ID"""
-        for goal in self.goals:
-            if goal.id == goal_id:
-                return goal
-        return None
+        position = self._goal_position(goal_id)
+        return self.goals[position] if position is not None else None
+
+    def add_goal(self, goal: Goal) -> Goal:
+        """Append a goal and register its position in the id index."""
+        self._goal_index().setdefault(goal.id, len(self.goals))
+        self.goals.append(goal)
+        self._indexed_count = len(self.goals)
+        return goal
+
+    def remove_goal(self, goal_id: str) -> Optional[Goal]:
+        """Remove and return the goal with the given ID, or None if absent.
+
+        List order is preserved because the UI renders goals in insertion order.
+        """
+        position = self._goal_position(goal_id)
+        if position is None:
+            return None
+        goal = self.goals.pop(position)
+        # Later goals shifted down one place; the next lookup rebuilds the index
+        self._indexed_goals = None
+        return goal
+
+    def add_message(self, message: Message) -> Message:
+        """Append a message and extend the LLM view with it."""
+        self.messages.append(message)
+        self.llm_messages()
+        return message
+
+    def llm_messages(self) -> List[Dict[str, str]]:
+        """Return the conversation as role/content dicts, oldest first.
+
+        Only messages appended since the last call are converted; the list is
+        rebuilt if self.messages was reassigned or shrank. The returned list is
+        shared and must not be mutated.
+        """
+        view = self._llm_view
+        if self._llm_view_source is not self.messages or len(view) > len(self.messages):
+            self._llm_view = view = []
+            self._llm_view_source = self.messages
+        for message in self.messages[len(view):]:
+            view.append({"role": message.role, "content": message.content})
+        return view
 
     def record_goal_history(self, turn: int, operation: str, goal_id: str,
                             goal_text: str, goal_type: str,
                             previous_goal_ids: list[str] = None,
-                            previous_goal_texts: list[str] = None):
-        """Append a GoalHistoryEntry tracking a goal mutation (REQ-04-02-205)."""
-        self.goal_history.append(GoalHistoryEntry(
+                            previous_goal_texts: list[str] = None,
+                            timestamp: Optional[str] = None):
+        """Append a GoalHistoryEntry tracking a goal mutation (REQ-04-02-205).
+
+        Callers recording several entries for one operation pass a shared
+        *timestamp*; otherwise the entry is stamped with the current time.
+        """
+        # Every argument comes from an already-validated Goal, so skip re-validation
+        self.goal_history.append(GoalHistoryEntry.model_construct(
             turn=turn,
             operation=operation,
             goal_id=goal_id,
@@ -117,4 +242,5 @@ class Conversation(BaseModel):
             goal_type=goal_type,
             previous_goal_ids=previous_goal_ids or [],
             previous_goal_texts=previous_goal_texts or [],
+            timestamp=timestamp or datetime.now().isoformat(),
         ))
@@ -2,34 +2,47 @@
 Pipeline Orchestrator — Coordinates the goal processing pipeline.
 
 Each stage is a focused async function. The orchestrator calls them in
-sequence and broadcasts results over the WebSocket connection.
+sequence and broadcasts results over the WebSocket connection. Frames carry
+the Pydantic models themselves; ConnectionManager serializes each frame in a
+single pydantic-core pass.
 """
 
+import asyncio
 import logging
 from datetime import datetime
-from typing import List
+from typing import Optional
 
-from backend.models import Goal, Message, GoalAlert
+from backend.models import Message, GoalAlert
 from backend.pipelines import (
-    infer_goals, merge_goals, evaluate_goal, stream_llm_response,
+    infer_goals, merge_goals, evaluate_goals_batch, stream_llm_response,
     extract_keyphrases, detect_forgetting, detect_contradiction, detect_derailment,
     detect_repetition, detect_fixation, compute_goal_progress, detect_breakdown,
     replace_outdated_goals,
 )
+from backend.pipelines.llm_streaming import STREAM_ERROR_MESSAGES
 
 logger = logging.getLogger(__name__)
 
+MIN_EVALUABLE_RESPONSE_LENGTH = 8
 
-async def run_goal_pipeline(conversation, user_message: str, message_id: str, websocket, manager):
+
+async def run_goal_pipeline(conversation, user_message: str, message_id: str, websocket, manager,
+                            turn_timestamp: Optional[str] = None):
     """Run the full goal pipeline: infer → merge → stream → evaluate → detect.
 
+    *turn_timestamp* is the user message's timestamp; goal history recorded
+    for this turn reuses it. The assistant message gets its own timestamp
+    once streaming finishes.
+
     Returns (assistant_message_id, response_text).
     """
-    await _run_inference(conversation, user_message, message_id, websocket, manager)
-    await _run_merge(conversation, user_message, message_id, websocket, manager)
+    # Bound once for the stages below; the message was just appended, so search from the end
+    user_msg = next(m for m in reversed(conversation.messages) if m.id == message_id)
+    await _run_inference(conversation, user_msg, websocket, manager)
+    await _run_merge(conversation, user_msg, websocket, manager, turn_timestamp)
 
     assistant_message_id = f"msg_{len(conversation.messages)}"
-    response_text = await _run_streaming(user_message, conversation.messages, assistant_message_id, websocket, manager)
+    response_text = await _run_streaming(user_message, conversation.llm_messages(), assistant_message_id, websocket, manager)
 
     assistant_msg = Message(
         id=assistant_message_id,
@@ -37,83 +50,114 @@ async def run_goal_pipeline(conversation, user_message: str, message_id: str, we
         role="assistant",
         timestamp=datetime.now().isoformat()
     )
-    conversation.messages.append(assistant_msg)
+    conversation.add_message(assistant_msg)
 
-    await _run_evaluation(conversation, response_text, assistant_message_id, websocket, manager)
-    await _run_keyphrases(response_text, assistant_message_id, websocket, manager)
+    # Keyphrases only need the response text, so overlap them with evaluation
+    await asyncio.gather(
+        _run_evaluation(conversation, response_text, assistant_message_id, websocket, manager),
+        _run_keyphrases(response_text, assistant_message_id, websocket, manager),
+    )
     await _run_detection_alerts(conversation, response_text, assistant_message_id, websocket, manager)
     await _send_goal_progress(conversation, websocket, manager)
 
     return assistant_message_id, response_text
 
 
-async def _run_inference(conversation, user_message: str, message_id: str, websocket, manager):
+async def _run_inference(conversation, user_msg: Message, websocket, manager):
     if not conversation.pipeline_settings.infer:
         return
 
-    user_msg = next(m for m in conversation.messages if m.id == message_id)
-    inferred = await infer_goals(user_message, message_id, len(conversation.goals))
+    message_id = user_msg.id
+    inferred = await infer_goals(user_msg.content, message_id, len(conversation.goals))
     user_msg.goals = inferred
 
-    if inferred:
+    # When the merge stage will run, it reports these goals in its goals_ready frame
+    if inferred and not _merge_will_run(conversation):
         await manager.send_message({
             "type": "goals_inferred",
-            "goals": [g.model_dump() for g in inferred],
+            "goals": inferred,
             "message_id": message_id,
         }, websocket)
 
 
-async def _run_merge(conversation, user_message: str, message_id: str, websocket, manager):
-    if not conversation.pipeline_settings.merge or not conversation.goals:
-        inferred = _get_inferred_goals(conversation, message_id)
+def _merge_will_run(conversation) -> bool:
+    return conversation.pipeline_settings.merge and bool(conversation.goals)
+
+
+async def _run_merge(conversation, user_msg: Message, websocket, manager,
+                     turn_timestamp: Optional[str] = None):
+    message_id = user_msg.id
+    inferred = user_msg.goals
+    if not _merge_will_run(conversation):
         if inferred:
             conversation.goals.extend(inferred)
         return
 
-    inferred = _get_inferred_goals(conversation, message_id)
     if not inferred:
         return
 
-    conversation.goals = await replace_outdated_goals(conversation.goals, inferred, message_id, conversation)
+    # Goals that restate an existing goal verbatim would only be kept by the
+    # merge, so they never reach the contradiction or merge LLM calls
+    novel = _exclude_restated_goals(conversation.goals, inferred)
+    if novel:
+        await _merge_novel_goals(conversation, novel, message_id, turn_timestamp)
+
+    await manager.send_message({
+        "type": "goals_ready",
+        "inferred": inferred,
+        "goals": conversation.goals,
+        "message_id": message_id,
+    }, websocket)
+
+
+def _exclude_restated_goals(existing_goals, inferred_goals):
+    existing_texts = {_normalized_goal_text(goal.text) for goal in existing_goals}
+    return [goal for goal in inferred_goals if _normalized_goal_text(goal.text) not in existing_texts]
+
+
+def _normalized_goal_text(text: str) -> str:
+    return " ".join(text.split()).casefold()
+
+
+async def _merge_novel_goals(conversation, novel, message_id: str, turn_timestamp: Optional[str]):
+    conversation.goals = await replace_outdated_goals(conversation.goals, novel, message_id, conversation)
 
     old_goals_snapshot = {g.id: g.model_copy() for g in conversation.goals}
-    merged_goals = await merge_goals(conversation.goals, inferred, message_id)
+    merged_goals = await merge_goals(conversation.goals, novel, message_id)
 
     turn_num = len([m for m in conversation.messages if m.role == "user"])
+    merged_at = turn_timestamp or datetime.now().isoformat()
     for mg in merged_goals:
-        prev_ids, prev_texts = _find_previous_goal_ids(mg, old_goals_snapshot, inferred)
+        prev_ids, prev_texts = _find_previous_goal_ids(mg, old_goals_snapshot, novel)
         op = _determine_operation(prev_ids, mg.id)
         conversation.record_goal_history(
             turn=turn_num, operation=op, goal_id=mg.id,
             goal_text=mg.text, goal_type=mg.type,
             previous_goal_ids=prev_ids, previous_goal_texts=prev_texts,
+            timestamp=merged_at,
         )
 
     conversation.goals = merged_goals
 
-    goals_data = [g.model_dump() for g in merged_goals]
-    await manager.send_message({
-        "type": "goals_updated",
-        "goals": goals_data,
-        "message_id": message_id,
-    }, websocket)
-
 
-async def _run_streaming(user_message: str, conversation_messages, assistant_message_id: str, websocket, manager) -> str:
+async def _run_streaming(user_message: str, llm_history, assistant_message_id: str, websocket, manager) -> str:
     return await stream_llm_response(
-        user_message, manager, websocket, assistant_message_id, conversation_messages
+        user_message, manager, websocket, assistant_message_id, llm_history
     )
 
 
+def _is_evaluable_response(response_text: str) -> bool:
+    # Empty/aborted replies and the streaming stage's error stubs can't address any
+    # goal; evaluating them would burn one LLM call per goal for nothing
+    return len(response_text.strip()) >= MIN_EVALUABLE_RESPONSE_LENGTH and response_text not in STREAM_ERROR_MESSAGES
+
+
 async def _run_evaluation(conversation, response_text: str, assistant_message_id: str, websocket, manager):
-    if not conversation.pipeline_settings.evaluate or not conversation.goals or not response_text:
+    if not conversation.pipeline_settings.evaluate or not conversation.goals or not _is_evaluable_response(response_text):
         return
 
-    evaluations = []
-    for goal in conversation.goals:
-        if not goal.completed:
-            evaluation = await evaluate_goal(goal, response_text)
-            evaluations.append(evaluation)
+    pending_goals = [goal for goal in conversation.goals if not goal.completed]
+    evaluations = await evaluate_goals_batch(pending_goals, response_text)
 
     if evaluations:
         await manager.send_message({
@@ -139,7 +183,19 @@ async def _run_keyphrases(response_text: str, assistant_message_id: str, websock
 async def _run_detection_alerts(conversation, response_text: str, assistant_message_id: str, websocket, manager):
     new_alerts = []
 
-    forgetting_results = await detect_forgetting(conversation.goals, response_text)
+    # The detectors only read goals/messages, so their LLM calls run concurrently
+    (
+        forgetting_results, contradiction_results, derailment_result,
+        repetition_result, fixation_result, breakdown_result,
+    ) = await asyncio.gather(
+        detect_forgetting(conversation.goals, response_text),
+        detect_contradiction(conversation.goals),
+        detect_derailment(conversation.goals, response_text),
+        detect_repetition(conversation.messages),
+        detect_fixation(conversation.goals),
+        detect_breakdown(conversation.messages, conversation.goals),
+    )
+
     for item in forgetting_results:
         new_alerts.append(GoalAlert(
             alert_type="forgetting", severity="warning",
@@ -148,7 +204,6 @@ async def _run_detection_alerts(conversation, response_text: str, assistant_mess
             suggestion=item.get("suggestion", ""),
         ))
 
-    contradiction_results = await detect_contradiction(conversation.goals)
     for item in contradiction_results:
         new_alerts.append(GoalAlert(
             alert_type="contradiction", severity="critical",
@@ -157,7 +212,6 @@ async def _run_detection_alerts(conversation, response_text: str, assistant_mess
             suggestion=item.get("resolution", ""),
         ))
 
-    derailment_result = await detect_derailment(conversation.goals, response_text)
     if derailment_result:
         new_alerts.append(GoalAlert(
             alert_type="derailment", severity="warning",
@@ -166,7 +220,6 @@ async def _run_detection_alerts(conversation, response_text: str, assistant_mess
             suggestion=derailment_result.get("suggestion", ""),
         ))
 
-    repetition_result = await detect_repetition(conversation.messages)
     if repetition_result:
         new_alerts.append(GoalAlert(
             alert_type="repetition", severity="warning",
@@ -175,7 +228,6 @@ async def _run_detection_alerts(conversation, response_text: str, assistant_mess
             suggestion=repetition_result.get("suggestion", ""),
         ))
 
-    fixation_result = await detect_fixation(conversation.goals)
     if fixation_result:
         goal_ids = fixation_result.get("fixated_goal_ids", []) + fixation_result.get("neglected_goal_ids", [])
         new_alerts.append(GoalAlert(
@@ -185,7 +237,6 @@ async def _run_detection_alerts(conversation, response_text: str, assistant_mess
             suggestion=fixation_result.get("suggestion", ""),
         ))
 
-    breakdown_result = await detect_breakdown(conversation.messages, conversation.goals)
     if breakdown_result:
         new_alerts.append(GoalAlert(
             alert_type="breakdown", severity="critical",
@@ -198,7 +249,7 @@ async def _run_detection_alerts(conversation, response_text: str, assistant_mess
         conversation.alerts.extend(new_alerts)
         await manager.send_message({
             "type": "alerts_detected",
-            "alerts": [a.model_dump() for a in new_alerts],
+            "alerts": new_alerts,
             "message_id": assistant_message_id,
         }, websocket)
 
@@ -212,13 +263,6 @@ async def _send_goal_progress(conversation, websocket, manager):
         }, websocket)
 
 
-def _get_inferred_goals(conversation, message_id: str) -> List[Goal]:
-    user_msg = next((m for m in conversation.messages if m.id == message_id), None)
-    if user_msg and user_msg.goals:
-        return user_msg.goals
-    return []
-
-
 def _find_previous_goal_ids(merged_goal, old_goals_snapshot, inferred_goals):
     prev_ids = []
     prev_texts = []
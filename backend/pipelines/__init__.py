@@ -6,7 +6,7 @@ Example:
 
 from backend.pipelines.goal_inference import infer_goals
 from backend.pipelines.goal_merge import merge_goals, replace_outdated_goals
-from backend.pipelines.goal_evaluation import evaluate_goal
+from backend.pipelines.goal_evaluation import evaluate_goal, evaluate_goals_batch
 from backend.pipelines.llm_streaming import stream_llm_response
 from backend.pipelines.keyphrase_extraction import extract_keyphrases
 from backend.pipelines.goal_detection import (
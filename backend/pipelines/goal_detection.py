@@ -29,7 +29,7 @@ async def detect_forgetting(goals: List[Goal], assistant_response: str) -> List[
     if not repeatedly_ignored:
         return []
 
-    goals_text = "\n".join([f"- {g.id}: {g.text} (ignored {1} time(s))" for g in repeatedly_ignored])
+    goals_text = "\n".join(f"- {g.id}: {g.text} (ignored {1} time(s))" for g in repeatedly_ignored)
 
     prompt = f"""You are analyzing whether the following conversation goals have been forgotten by the assistant. A "forgotten" goal is one that has been consistently ignored across responses.
 
@@ -58,7 +58,7 @@ async def detect_contradiction(goals: List[Goal]) -> List[Dict]:
     if len(active_goals) < 2:
         return []
 
-    goals_text = "\n".join([f"- {g.id}: {g.text} (type: {g.type})" for g in active_goals])
+    goals_text = "\n".join(f"- {g.id}: {g.text} (type: {g.type})" for g in active_goals)
 
     prompt = f"""You are analyzing whether any of the following conversation goals contradict each other. Two goals contradict if they cannot both be satisfied simultaneously or if pursuing one would undermine the other.
 
@@ -85,7 +85,7 @@ async def detect_derailment(goals: List[Goal], assistant_response: str) -> Optio
     if not active_goals or not assistant_response:
         return None
 
-    goals_text = "\n".join([f"- {g.id}: {g.text}" for g in active_goals])
+    goals_text = "\n".join(f"- {g.id}: {g.text}" for g in active_goals)
 
     prompt = f"""You are analyzing whether the assistant's response has derailed from the conversation goals. Derailment means the response has drifted away from addressing any of the active goals without substantively engaging with any of them.
 
@@ -4,14 +4,18 @@ Goal Evaluation Stage — Assess how assistant responses address tracked goals.
 Implements Appendix A.3 of the OnGoal requirements.
 """
 
+import asyncio
 import logging
-from typing import Dict
+from typing import Dict, List
 
 from backend.models import Goal, GoalEvaluation
 from backend.llm_caller import call_llm_json
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on evaluation calls in flight at once, to stay under provider rate limits
+MAX_CONCURRENT_EVALUATIONS = 16
+
 
 async def evaluate_goal(goal: Goal, assistant_response: str) -> Dict:
     """Evaluate how assistant response addresses a goal using prompt from OnGoal requirements (Appendix A.3)"""
@@ -41,7 +45,7 @@ Assistant response: {assistant_response}"""
             )
             goal.evaluation = evaluation
             goal.status = evaluation.category
-            return evaluation.model_dump()
+            return evaluation.model_dump(mode="json")
 
         fallback = GoalEvaluation(
             goal_id=goal.id, category="ignore",
@@ -49,7 +53,7 @@ Assistant response: {assistant_response}"""
         )
         goal.evaluation = fallback
         goal.status = "ignore"
-        return fallback.model_dump()
+        return fallback.model_dump(mode="json")
 
     except Exception as e:
         logger.warning("Goal evaluation failed for %s: %s", goal.id, e)
@@ -57,4 +61,21 @@ Assistant response: {assistant_response}"""
                                      explanation="Unable to evaluate goal due to service error")
         goal.evaluation = error_eval
         goal.status = "ignore"
-        return error_eval.model_dump()
\ No newline at end of file
+        return error_eval.model_dump(mode="json")
+
+
+async def evaluate_goals_batch(goals: List[Goal], assistant_response: str,
+                               max_concurrency: int = MAX_CONCURRENT_EVALUATIONS) -> List[Dict]:
+    """Evaluate several goals against one response concurrently.
+
+    N goals cost roughly one LLM round trip instead of N. Results are
+    returned in the same order as *goals*; each goal is also updated in
+    place exactly as evaluate_goal() does.
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def _evaluate_bounded(goal: Goal) -> Dict:
+        async with semaphore:
+            return await evaluate_goal(goal, assistant_response)
+
+    return list(await asyncio.gather(*(_evaluate_bounded(goal) for goal in goals)))
@@ -5,14 +5,42 @@ Implements Appendix A.1 of the OnGoal requirements.
 """
 
 import logging
+from collections import OrderedDict
 from datetime import datetime
-from typing import List
+from typing import List, Tuple
 
 from backend.models import Goal
 from backend.llm_caller import call_llm_json
 
 logger = logging.getLogger(__name__)
 
+# Inference depends only on the message text, so UI retries and resends of
+# the same message reuse the earlier clauses instead of another LLM call
+INFERENCE_CACHE_SIZE = 256
+_inference_cache: "OrderedDict[str, Tuple[Tuple[str, str, str], ...]]" = OrderedDict()
+
+
+def clear_inference_cache() -> None:
+    """Drop every cached inference result."""
+    _inference_cache.clear()
+
+
+def _build_goals(clauses: Tuple[Tuple[str, str, str], ...], message_id: str, first_index: int) -> List[Goal]:
+    # Clauses from one message are inferred together and share a timestamp
+    inferred_at = datetime.now().isoformat()
+    # The clause strings are type-checked before caching, so skip full validation
+    return [
+        Goal.model_construct(
+            id=f"G{first_index + offset}",
+            text=clause,
+            type=clause_type,
+            summary=summary,
+            source_message_id=message_id,
+            created_at=inferred_at
+        )
+        for offset, (clause, clause_type, summary) in enumerate(clauses)
+    ]
+
 
 async def infer_goals(message: str, message_id: str, existing_goals_count: int = 0) -> List[Goal]:
     """Extract goals from user message using exact prompt from OnGoal requirements (Appendix A.1)"""
@@ -24,6 +52,12 @@ async def infer_goals(message: str, message_id: str, existing_goals_count: int =
     if len(message) > MAX_MESSAGE_LENGTH:
         raise ValueError(f"Message too long (max {MAX_MESSAGE_LENGTH} chars)")
 
+    cache_key = " ".join(message.split())
+    cached = _inference_cache.get(cache_key)
+    if cached is not None:
+        _inference_cache.move_to_end(cache_key)
+        return _build_goals(cached, message_id, existing_goals_count)
+
     inference_prompt = f"""You will be presented with human dialogue in a conversation with you, an assistant. Your task is to extract every clause verbatim from the document exactly as it appears.
 
 List all clauses in the dialogue that are either a question, request, offer, or suggestion. Briefly summarize how to address the goal of the clause in ONE sentence.
@@ -44,21 +78,19 @@ Human dialogue: {message}"""
             response_data = await call_llm_json(inference_prompt, max_tokens=1000, label="Goal inference")
             clauses_data = response_data.get("clauses", []) if response_data else []
 
-            goals = []
-            total_prior = existing_goals_count
+            clauses = []
             for clause_data in clauses_data:
-                goal = Goal(
-                    id=f"G{total_prior}",
-                    text=clause_data["clause"],
-                    type=clause_data["type"],
-                    summary=clause_data.get("summary", ""),
-                    source_message_id=message_id,
-                    created_at=datetime.now().isoformat()
-                )
-                total_prior += 1
-                goals.append(goal)
-
-            return goals
+                clause = (clause_data["clause"], clause_data["type"], clause_data.get("summary", ""))
+                if not all(isinstance(value, str) for value in clause):
+                    raise TypeError(f"Non-string field in clause: {clause_data!r}")
+                clauses.append(clause)
+
+            if clauses:
+                _inference_cache[cache_key] = tuple(clauses)
+                if len(_inference_cache) > INFERENCE_CACHE_SIZE:
+                    _inference_cache.popitem(last=False)
+
+            return _build_goals(clauses, message_id, existing_goals_count)
 
         except (KeyError, TypeError) as e:
             logger.warning("Goal inference parse error (attempt %d): %s", attempt + 1, e)
@@ -69,4 +101,4 @@ Human dialogue: {message}"""
             logger.warning("Goal inference failed: %s", e)
             return []
 
-    return []
\ No newline at end of file
+    return []
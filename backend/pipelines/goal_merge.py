@@ -29,15 +29,23 @@ async def replace_outdated_goals(existing_goals: List[Goal], new_goals: List[Goa
     if not contradictions:
         return existing_goals
 
+    # First occurrence wins, matching a front-to-back scan
+    goals_by_id = {g.id: g for g in reversed(combined)}
     replaced_ids = set()
+    turn = len([m for m in conversation.messages if m.role == "user"])
+    replaced_at = datetime.now().isoformat()
     for c in contradictions:
         gid1 = c.get("goal_id_1")
         gid2 = c.get("goal_id_2")
         reason = c.get("reason", "Contradicts newer goal")
 
+        # Ids come straight from LLM JSON; non-strings (even unhashable ones) can't name a goal
+        if not isinstance(gid1, str) or not isinstance(gid2, str):
+            continue
+
         # Determine which goal is older (from existing_goals vs new_goals)
-        goal1 = next((g for g in combined if g.id == gid1), None)
-        goal2 = next((g for g in combined if g.id == gid2), None)
+        goal1 = goals_by_id.get(gid1)
+        goal2 = goals_by_id.get(gid2)
         if not goal1 or not goal2:
             continue
 
@@ -52,11 +60,11 @@ async def replace_outdated_goals(existing_goals: List[Goal], new_goals: List[Goa
         old_goal.status = "replaced"
         replaced_ids.add(old_goal.id)
 
-        turn = len([m for m in conversation.messages if m.role == "user"])
         conversation.record_goal_history(
             turn=turn, operation="replace", goal_id=old_goal.id,
             goal_text=old_goal.text, goal_type=old_goal.type,
             previous_goal_ids=[new_goal.id], previous_goal_texts=[new_goal.text],
+            timestamp=replaced_at,
         )
 
     return [g for g in existing_goals if g.id not in replaced_ids]
@@ -77,8 +85,8 @@ async def merge_goals(old_goals: List[Goal], new_goals: List[Goal], current_mess
     if not mergeable_old:
         return locked_goals + new_goals
 
-    old_goals_str_list = "\n".join([f"{i+1}. {goal.text}" for i, goal in enumerate(mergeable_old)])
-    new_goals_str_list = "\n".join([f"{i+1}. {goal.text}" for i, goal in enumerate(new_goals)])
+    old_goals_str_list = "\n".join(f"{i+1}. {goal.text}" for i, goal in enumerate(mergeable_old))
+    new_goals_str_list = "\n".join(f"{i+1}. {goal.text}" for i, goal in enumerate(new_goals))
     
     # ENHANCED PROMPT - Based on OnGoal Requirements Appendix A.2 with semantic contradiction awareness
     merge_prompt = f"""You have one set of old numbered bullet point goals:
@@ -125,9 +133,13 @@ Please respond ONLY with a valid JSON in the following format:
         merged_goals = []
         all_mergeable = mergeable_old + new_goals
         goal_counter = 0
+        # One timestamp for the whole merge; goals created together share it
+        merged_at = datetime.now().isoformat()
         
         for operation in operations:
             updated_goal_text = operation["updated_goal"]
+            if not isinstance(updated_goal_text, str):
+                raise TypeError(f"Non-string updated_goal: {updated_goal_text!r}")
             operation_type = operation["operation"]
             goal_numbers = operation.get("goal_numbers", [])
             
@@ -148,14 +160,15 @@ Please respond ONLY with a valid JSON in the following format:
             if not source_goal:
                 source_goal = mergeable_old[0] if mergeable_old else new_goals[0]
             
-            merged_goal = Goal(
+            # Every other field is copied from an already-validated Goal
+            merged_goal = Goal.model_construct(
                 id=f"G{goal_counter}",
                 text=updated_goal_text,
                 type=source_goal.type,
                 source_message_id=current_message_id or source_goal.source_message_id,
                 locked=False,
                 completed=source_goal.completed,
-                created_at=datetime.now().isoformat()
+                created_at=merged_at
             )
             goal_counter += 1
             merged_goals.append(merged_goal)
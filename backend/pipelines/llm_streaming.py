@@ -2,18 +2,68 @@
 LLM Streaming Stage — Stream assistant responses with mid-stream disconnect handling.
 """
 
+import asyncio
 import logging
-from typing import List
+from contextlib import aclosing
+from typing import AsyncIterator, Dict, List
 
 import backend.llm_provider as llm_provider
 
 logger = logging.getLogger(__name__)
 
+# Tokens are small, so one frame per token is mostly framing overhead.
+# Chunks are coalesced until this many arrive or this much time passes.
+STREAM_BATCH_MAX_CHUNKS = 16
+STREAM_BATCH_MAX_DELAY_SECONDS = 0.03
 
-async def stream_llm_response(message: str, connection_manager, websocket, message_id: str, conversation_messages: List):
-    """Stream LLM response using the configured provider"""
+# Returned in place of a response when no text could be generated
+LLM_UNAVAILABLE_MESSAGE = "LLM service unavailable - API key not configured"
+LLM_FAILURE_MESSAGE = "Unable to generate response. Please check your API key configuration."
+STREAM_ERROR_MESSAGES = frozenset({LLM_UNAVAILABLE_MESSAGE, LLM_FAILURE_MESSAGE})
+
+
+async def _batch_chunks(stream: AsyncIterator[str], max_chunks: int, max_delay: float) -> AsyncIterator[str]:
+    """Concatenate runs of stream chunks: up to *max_chunks*, or whatever arrives within *max_delay* of the first."""
+    loop = asyncio.get_running_loop()
+    iterator = stream.__aiter__()
+    pending = None
+    try:
+        while True:
+            if pending is None:
+                pending = asyncio.ensure_future(iterator.__anext__())
+            try:
+                batch = [await pending]
+            except StopAsyncIteration:
+                return
+            pending = None
+            deadline = loop.time() + max_delay
+            while len(batch) < max_chunks:
+                pending = asyncio.ensure_future(iterator.__anext__())
+                done, _ = await asyncio.wait({pending}, timeout=max(deadline - loop.time(), 0))
+                if not done:
+                    # Timer expired; the in-flight chunk opens the next batch
+                    break
+                try:
+                    batch.append(pending.result())
+                except StopAsyncIteration:
+                    pending = None
+                    yield "".join(batch)
+                    return
+                pending = None
+            yield "".join(batch)
+    finally:
+        if pending is not None:
+            pending.cancel()
+
+
+async def stream_llm_response(message: str, connection_manager, websocket, message_id: str, llm_history: List[Dict[str, str]]):
+    """Stream LLM response using the configured provider.
+
+    *llm_history* is the prior conversation as role/content dicts, normally
+    Conversation.llm_messages(); it is not mutated.
+    """
     if not llm_provider.is_available():
-        error_msg = "LLM service unavailable - API key not configured"
+        error_msg = LLM_UNAVAILABLE_MESSAGE
         await connection_manager.send_message({
             "type": "error",
             "message": error_msg
@@ -21,46 +71,46 @@ async def stream_llm_response(message: str, connection_manager, websocket, messa
         return error_msg
 
     try:
-        messages_for_llm = []
-
-        if conversation_messages:
-            for msg in conversation_messages:
-                messages_for_llm.append({
-                    "role": msg.role,
-                    "content": msg.content
-                })
-
-        messages_for_llm.append({
+        # The history dicts are shared with the conversation; only the list is new
+        messages_for_llm = [*llm_history, {
             "role": "user",
             "content": message
-        })
+        }]
 
-        full_response = ""
-        async for text_chunk in llm_provider.generate_stream(messages_for_llm, max_tokens=2000):
-            full_response += text_chunk
+        # Collect chunks and join once; += on str is quadratic over a long reply
+        response_parts: List[str] = []
+        # Bound once: this loop runs per streamed batch
+        send_message = connection_manager.send_message
+        batches = _batch_chunks(
+            llm_provider.generate_stream(messages_for_llm, max_tokens=2000),
+            STREAM_BATCH_MAX_CHUNKS, STREAM_BATCH_MAX_DELAY_SECONDS,
+        )
+        async with aclosing(batches):
+            async for text_chunk in batches:
+                response_parts.append(text_chunk)
 
-            send_ok = await connection_manager.send_message({
-                "type": "llm_response_chunk",
-                "text": text_chunk,
-                "message_id": message_id
-            }, websocket)
+                send_ok = await send_message({
+                    "type": "llm_response_chunk",
+                    "text": text_chunk,
+                    "message_id": message_id
+                }, websocket)
 
-            # Stop burning tokens if the client disconnected mid-stream
-            if not send_ok:
-                logger.info("WebSocket disconnected mid-stream (message %s) — stopping LLM", message_id)
-                return full_response
+                # Stop burning tokens if the client disconnected mid-stream
+                if not send_ok:
+                    logger.info("WebSocket disconnected mid-stream (message %s) — stopping LLM", message_id)
+                    return "".join(response_parts)
 
+        # The client already assembled the text from the chunks; don't ship it twice
         await connection_manager.send_message({
             "type": "llm_response_complete",
-            "message_id": message_id,
-            "full_text": full_response
+            "message_id": message_id
         }, websocket)
 
-        return full_response
+        return "".join(response_parts)
 
     except Exception as e:
         logger.error("LLM streaming error: %s", e)
-        error_msg = "Unable to generate response. Please check your API key configuration."
+        error_msg = LLM_FAILURE_MESSAGE
         await connection_manager.send_message({
             "type": "error",
             "message": error_msg
@@ -6,8 +6,10 @@ Exports the LLMProvider ABC, retry utilities, and all concrete provider classes.
 
 import asyncio
 import logging
+import socket
+import weakref
 from abc import ABC, abstractmethod
-from typing import AsyncGenerator, Dict, List
+from typing import AsyncGenerator, Dict, List, Optional
 
 import httpx
 
@@ -49,6 +51,64 @@ async def retry_with_backoff(func, max_retries: int = DEFAULT_MAX_RETRIES,
     raise last_exception
 
 
+class LoopBoundClient:
+    """Lazily built httpx.AsyncClient tied to the event loop that created it.
+
+    Pooled keep-alive connections belong to one loop, while a cached provider
+    outlives it (repeated asyncio.run calls, per-test loops). A call from a
+    different loop gets a fresh client, and the old one is released: closed on
+    its own loop if that loop is still running, otherwise by shutting down its
+    sockets directly, since a finished loop can no longer run aclose().
+    """
+
+    def __init__(self, **client_kwargs):
+        self._client_kwargs = client_kwargs
+        self._client: Optional[httpx.AsyncClient] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        # Network streams opened by the current client, for the no-loop release
+        self._streams: "weakref.WeakSet" = weakref.WeakSet()
+
+    def get(self) -> httpx.AsyncClient:
+        loop = asyncio.get_running_loop()
+        if self._client is not None and self._loop is not loop:
+            self._release()
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(**self._client_kwargs)
+            self._client.event_hooks["response"].append(self._track_stream)
+            self._loop = loop
+        return self._client
+
+    async def _track_stream(self, response: httpx.Response) -> None:
+        stream = response.extensions.get("network_stream")
+        if stream is not None:
+            self._streams.add(stream)
+
+    def _release(self) -> None:
+        client, loop, streams = self._client, self._loop, list(self._streams)
+        self._client = self._loop = None
+        self._streams = weakref.WeakSet()
+        if client is None or client.is_closed:
+            return
+        if loop is not None and loop.is_running():
+            asyncio.run_coroutine_threadsafe(client.aclose(), loop)
+            return
+        for stream in streams:
+            sock = stream.get_extra_info("socket")
+            if sock is not None:
+                try:
+                    sock.shutdown(socket.SHUT_RDWR)
+                except OSError:
+                    pass
+
+    async def aclose(self) -> None:
+        if self._client is not None and self._loop is asyncio.get_running_loop():
+            client, self._client, self._loop = self._client, None, None
+            self._streams = weakref.WeakSet()
+            await client.aclose()
+        else:
+            self._release()
+
+
 class LLMProvider(ABC):
 
     @abstractmethod
@@ -61,6 +121,9 @@ class LLMProvider(ABC):
     ) -> AsyncGenerator[str, None]:
         ...
 
+    async def aclose(self) -> None:
+        """Release pooled HTTP connections. Providers without a long-lived client need not override."""
+
     @abstractmethod
     def is_available(self) -> bool:
         ...
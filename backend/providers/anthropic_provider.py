@@ -3,8 +3,17 @@
 import os
 from typing import AsyncGenerator, Dict, List
 
+import httpx
+
 from backend.providers import LLMProvider
 
+# Sized for a pipeline turn that fans out inference, merge, per-goal
+# evaluation and detection calls at once; idle keep-alive connections let
+# bursts reuse the TLS session instead of renegotiating it
+MAX_CONNECTIONS = 64
+MAX_KEEPALIVE_CONNECTIONS = 32
+REQUEST_TIMEOUT_SECONDS = 60.0
+
 
 class AnthropicProvider(LLMProvider):
 
@@ -15,7 +24,14 @@ class AnthropicProvider(LLMProvider):
         if api_key:
             import anthropic
 
-            self.client = anthropic.AsyncAnthropic(api_key=api_key)
+            http_client = anthropic.DefaultAsyncHttpxClient(
+                limits=httpx.Limits(
+                    max_connections=MAX_CONNECTIONS,
+                    max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS,
+                ),
+                timeout=REQUEST_TIMEOUT_SECONDS,
+            )
+            self.client = anthropic.AsyncAnthropic(api_key=api_key, http_client=http_client)
 
     async def generate(self, prompt: str, max_tokens: int = 1000) -> str:
         if not self.client:
@@ -42,6 +58,10 @@ class AnthropicProvider(LLMProvider):
             if chunk.type == "content_block_delta" and hasattr(chunk.delta, "text"):
                 yield chunk.delta.text
 
+    async def aclose(self) -> None:
+        if self.client:
+            await self.client.close()
+
     def is_available(self) -> bool:
         return self.client is not None
 
@@ -11,7 +11,7 @@ from typing import AsyncGenerator, Dict, List
 
 import httpx
 
-from backend.providers import LLMProvider, retry_with_backoff, DEFAULT_MAX_RETRIES, DEFAULT_RETRY_DELAY_MS
+from backend.providers import LLMProvider, LoopBoundClient, retry_with_backoff, DEFAULT_MAX_RETRIES, DEFAULT_RETRY_DELAY_MS
 
 logger = logging.getLogger(__name__)
 
@@ -24,9 +24,9 @@ class OllamaCloudApiProvider(LLMProvider):
         self.model = os.getenv("OLLAMA_CLOUD_MODEL", "gemma3:27b")
         self.max_retries = int(os.getenv("OLLAMA_MAX_RETRIES", str(DEFAULT_MAX_RETRIES)))
         self.retry_delay_ms = int(os.getenv("OLLAMA_RETRY_DELAY_MS", str(DEFAULT_RETRY_DELAY_MS)))
-
-    def _get_client(self) -> httpx.AsyncClient:
-        return httpx.AsyncClient(
+        # One pooled client per provider and event loop: keep-alive
+        # connections skip the TCP + TLS handshake on every call after the first
+        self._http = LoopBoundClient(
             timeout=120.0,
             headers={
                 "Authorization": f"Bearer {self.api_key}",
@@ -34,20 +34,23 @@ class OllamaCloudApiProvider(LLMProvider):
             },
         )
 
+    @property
+    def client(self) -> httpx.AsyncClient:
+        return self._http.get()
+
     async def generate(self, prompt: str, max_tokens: int = 1000) -> str:
         async def _call():
-            async with self._get_client() as client:
-                response = await client.post(
-                    f"{self.base_url}/chat/completions",
-                    json={
-                        "model": self.model,
-                        "messages": [{"role": "user", "content": prompt}],
-                        "max_tokens": max_tokens,
-                    },
-                )
-                response.raise_for_status()
-                data = response.json()
-                return data["choices"][0]["message"]["content"].strip()
+            response = await self.client.post(
+                f"{self.base_url}/chat/completions",
+                json={
+                    "model": self.model,
+                    "messages": [{"role": "user", "content": prompt}],
+                    "max_tokens": max_tokens,
+                },
+            )
+            response.raise_for_status()
+            data = response.json()
+            return data["choices"][0]["message"]["content"].strip()
 
         return await retry_with_backoff(
             _call, max_retries=self.max_retries, initial_delay_ms=self.retry_delay_ms,
@@ -60,31 +63,30 @@ class OllamaCloudApiProvider(LLMProvider):
         from backend.providers import is_retryable_status
 
         async def _stream():
-            async with self._get_client() as client:
-                async with client.stream(
-                    "POST",
-                    f"{self.base_url}/chat/completions",
-                    json={
-                        "model": self.model,
-                        "messages": messages,
-                        "max_tokens": max_tokens,
-                        "stream": True,
-                    },
-                ) as response:
-                    response.raise_for_status()
-                    async for line in response.aiter_lines():
-                        if not line.startswith("data: "):
-                            continue
-                        payload = line[6:].strip()
-                        if payload == "[DONE]":
-                            break
-                        try:
-                            chunk = json.loads(payload)
-                            content = chunk["choices"][0].get("delta", {}).get("content", "")
-                            if content:
-                                yield content
-                        except (json.JSONDecodeError, KeyError, IndexError):
-                            continue
+            async with self.client.stream(
+                "POST",
+                f"{self.base_url}/chat/completions",
+                json={
+                    "model": self.model,
+                    "messages": messages,
+                    "max_tokens": max_tokens,
+                    "stream": True,
+                },
+            ) as response:
+                response.raise_for_status()
+                async for line in response.aiter_lines():
+                    if not line.startswith("data: "):
+                        continue
+                    payload = line[6:].strip()
+                    if payload == "[DONE]":
+                        break
+                    try:
+                        chunk = json.loads(payload)
+                        content = chunk["choices"][0].get("delta", {}).get("content", "")
+                        if content:
+                            yield content
+                    except (json.JSONDecodeError, KeyError, IndexError):
+                        continue
 
         last_exception = None
         for attempt in range(self.max_retries):
@@ -112,6 +114,9 @@ class OllamaCloudApiProvider(LLMProvider):
                 await asyncio.sleep(delay)
         raise last_exception
 
+    async def aclose(self) -> None:
+        await self._http.aclose()
+
     def is_available(self) -> bool:
         return bool(self.api_key)
 
@@ -12,7 +12,7 @@ from typing import AsyncGenerator, Dict, List
 
 import httpx
 
-from backend.providers import LLMProvider, retry_with_backoff
+from backend.providers import LLMProvider, LoopBoundClient, retry_with_backoff
 
 logger = logging.getLogger(__name__)
 
@@ -26,28 +26,31 @@ class OllamaProvider(LLMProvider):
         self._is_cloud = self.model.endswith(":cloud") or self.model.endswith("-cloud")
         self.max_retries = int(os.getenv("OLLAMA_MAX_RETRIES", str(DEFAULT_MAX_RETRIES)))
         self.retry_delay_ms = int(os.getenv("OLLAMA_RETRY_DELAY_MS", str(DEFAULT_RETRY_DELAY_MS)))
+        # One pooled client per provider and event loop: keep-alive connections
+        # are reused across the inference, merge and evaluation calls of a turn
+        self._http = LoopBoundClient(timeout=120.0)
 
-    def _get_client(self) -> httpx.AsyncClient:
-        return httpx.AsyncClient(timeout=120.0)
+    @property
+    def client(self) -> httpx.AsyncClient:
+        return self._http.get()
 
     async def generate(self, prompt: str, max_tokens: int = 1000) -> str:
         async def _call():
-            async with self._get_client() as client:
-                response = await client.post(
-                    f"{self.base_url}/api/generate",
-                    json={
-                        "model": self.model,
-                        "prompt": prompt,
-                        "stream": False,
-                        "options": {"num_predict": max_tokens},
-                    },
-                )
-                response.raise_for_status()
-                data = response.json()
-                content = data.get("response", "").strip()
-                if not content and "thinking" in data:
-                    content = data["thinking"].strip()
-                return content
+            response = await self.client.post(
+                f"{self.base_url}/api/generate",
+                json={
+                    "model": self.model,
+                    "prompt": prompt,
+                    "stream": False,
+                    "options": {"num_predict": max_tokens},
+                },
+            )
+            response.raise_for_status()
+            data = response.json()
+            content = data.get("response", "").strip()
+            if not content:
+                content = data.get("thinking", "").strip()
+            return content
 
         return await retry_with_backoff(
             _call, max_retries=self.max_retries, initial_delay_ms=self.retry_delay_ms,
@@ -60,31 +63,30 @@ class OllamaProvider(LLMProvider):
         from backend.providers import is_retryable_status
 
         async def _stream():
-            async with self._get_client() as client:
-                async with client.stream(
-                    "POST",
-                    f"{self.base_url}/api/chat",
-                    json={
-                        "model": self.model,
-                        "messages": messages,
-                        "stream": True,
-                        "options": {"num_predict": max_tokens},
-                    },
-                ) as response:
-                    response.raise_for_status()
-                    async for line in response.aiter_lines():
-                        if not line.strip():
-                            continue
-                        try:
-                            chunk = json.loads(line)
-                            msg = chunk.get("message", {})
-                            content = msg.get("content", "")
-                            if content:
-                                yield content
-                            if chunk.get("done", False):
-                                break
-                        except json.JSONDecodeError:
-                            continue
+            async with self.client.stream(
+                "POST",
+                f"{self.base_url}/api/chat",
+                json={
+                    "model": self.model,
+                    "messages": messages,
+                    "stream": True,
+                    "options": {"num_predict": max_tokens},
+                },
+            ) as response:
+                response.raise_for_status()
+                async for line in response.aiter_lines():
+                    if not line.strip():
+                        continue
+                    try:
+                        chunk = json.loads(line)
+                        msg = chunk.get("message", {})
+                        content = msg.get("content", "")
+                        if content:
+                            yield content
+                        if chunk.get("done", False):
+                            break
+                    except json.JSONDecodeError:
+                        continue
 
         last_exception = None
         for attempt in range(self.max_retries):
@@ -112,6 +114,9 @@ class OllamaProvider(LLMProvider):
                 await asyncio.sleep(delay)
         raise last_exception
 
+    async def aclose(self) -> None:
+        await self._http.aclose()
+
     def is_available(self) -> bool:
         return True
 
@@ -68,6 +68,9 @@ class OpenRouterProvider(LLMProvider):
                 except (json.JSONDecodeError, KeyError, IndexError):
                     continue
 
+    async def aclose(self) -> None:
+        await self.client.aclose()
+
     def is_available(self) -> bool:
         return bool(self.api_key)
 
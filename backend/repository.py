@@ -59,10 +59,9 @@ class ConversationRepository:
 
     def delete(self, conversation_id: str) -> bool:
         """Remove conversation and its lock. Returns True if existed."""
-        existed = conversation_id in self._store
-        self._store.pop(conversation_id, None)
+        removed = self._store.pop(conversation_id, None)
         self._locks.pop(conversation_id, None)
-        return existed
+        return removed is not None
 
     def all_ids(self) -> list[str]:
         """Return list of all stored conversation IDs."""
@@ -0,0 +1,17 @@
+"""
+OnGoal Responses - JSON response class backed by pydantic-core
+"""
+from typing import Any
+from fastapi.responses import JSONResponse
+from pydantic_core import to_json
+
+
+class PydanticJSONResponse(JSONResponse):
+    """JSONResponse that renders with pydantic-core's Rust encoder instead of stdlib json.
+
+    Used as the app-wide default response class. Pydantic models nested
+    anywhere in the content are serialized directly, without a model_dump().
+    """
+
+    def render(self, content: Any) -> bytes:
+        return to_json(content)
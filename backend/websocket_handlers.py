@@ -1,11 +1,13 @@
 """
 OnGoal WebSocket Handlers - Real-time communication with frontend
 """
-import json
+import asyncio
 import logging
 from datetime import datetime
 from fastapi import WebSocket, WebSocketDisconnect
+from pydantic_core import from_json, to_jsonable_python
 
+from backend.connection_manager import encode_message
 from backend.models import Message
 from backend.pipelines import compute_goal_progress
 from backend.pipeline_orchestrator import run_goal_pipeline
@@ -13,6 +15,9 @@ from backend.api_endpoints import conversation_repository
 
 logger = logging.getLogger(__name__)
 
+# Below this many messages the thread hop costs more than serializing inline
+OFFLOAD_SERIALIZATION_MIN_MESSAGES = 32
+
 
 async def handle_websocket_connection(websocket: WebSocket, manager, conversation_id: str = "default"):
     """Handle WebSocket connection and message processing"""
@@ -23,16 +28,11 @@ async def handle_websocket_connection(websocket: WebSocket, manager, conversatio
     try:
         while True:
             data = await websocket.receive_text()
-            message_data = json.loads(data)
-
-            if message_data["type"] == "user_message":
-                await handle_user_message(message_data, conversation_id, websocket, manager)
+            message_data = from_json(data)
 
-            elif message_data["type"] == "toggle_pipeline":
-                await handle_pipeline_toggle(message_data, conversation_id, websocket, manager)
-
-            elif message_data["type"] == "get_conversation":
-                await handle_get_conversation(conversation_id, websocket, manager)
+            handler = _MESSAGE_HANDLERS.get(message_data["type"])
+            if handler:
+                await handler(message_data, conversation_id, websocket, manager)
 
     except WebSocketDisconnect:
         manager.disconnect(websocket)
@@ -47,16 +47,17 @@ async def handle_user_message(message_data, conversation_id, websocket, manager)
 
         user_message = message_data["message"]
         message_id = f"msg_{len(conversation.messages)}"
+        turn_timestamp = datetime.now().isoformat()
 
         user_msg = Message(
             id=message_id,
             content=user_message,
             role="user",
-            timestamp=datetime.now().isoformat()
+            timestamp=turn_timestamp
         )
-        conversation.messages.append(user_msg)
+        conversation.add_message(user_msg)
 
-        await run_goal_pipeline(conversation, user_message, message_id, websocket, manager)
+        await run_goal_pipeline(conversation, user_message, message_id, websocket, manager, turn_timestamp)
 
 
 async def handle_pipeline_toggle(message_data, conversation_id, websocket, manager):
@@ -64,7 +65,7 @@ async def handle_pipeline_toggle(message_data, conversation_id, websocket, manag
     conversation = conversation_repository.get_or_create(conversation_id)
     stage = message_data["stage"]
     enabled = message_data["enabled"]
-    setattr(conversation.pipeline_settings, stage, enabled)
+    conversation.pipeline_settings = conversation.pipeline_settings.with_stage(stage, enabled)
 
     await manager.send_message({
         "type": "pipeline_toggled",
@@ -76,15 +77,35 @@ async def handle_pipeline_toggle(message_data, conversation_id, websocket, manag
 async def handle_get_conversation(conversation_id, websocket, manager):
     """Handle get conversation request"""
     conversation = conversation_repository.get_or_create(conversation_id)
-    await manager.send_message({
+    # Models go in as-is: the whole frame is serialized in one pydantic-core
+    # pass instead of a model_dump() per message and goal.
+    frame = {
         "type": "conversation_state",
         "conversation": {
             "id": conversation.id,
-            "messages": [msg.model_dump() for msg in conversation.messages],
-            "goals": [goal.model_dump() for goal in conversation.goals],
-            "alerts": [alert.model_dump() for alert in conversation.alerts],
-            "pipeline_settings": conversation.pipeline_settings.model_dump(),
-            "goal_history": [entry.model_dump() for entry in conversation.goal_history],
+            "messages": list(conversation.messages),
+            "goals": list(conversation.goals),
+            "alerts": list(conversation.alerts),
+            "pipeline_settings": conversation.pipeline_settings,
+            "goal_history": list(conversation.goal_history),
             "goal_progress": compute_goal_progress(conversation),
         }
-    }, websocket)
\ No newline at end of file
+    }
+    if len(conversation.messages) < OFFLOAD_SERIALIZATION_MIN_MESSAGES:
+        payload = encode_message(frame)
+    else:
+        # Long histories take real CPU to encode; keep the event loop free for
+        # other clients. Goals and messages are mutable, so the frame is turned
+        # into plain data here on the loop, where no pipeline task can change
+        # it mid-way, and only the JSON writing moves to the worker thread.
+        payload = await asyncio.to_thread(encode_message, to_jsonable_python(frame))
+    await manager.send_encoded(payload, websocket)
+
+
+# Inbound message type → handler(message_data, conversation_id, websocket, manager)
+_MESSAGE_HANDLERS = {
+    "user_message": handle_user_message,
+    "toggle_pipeline": handle_pipeline_toggle,
+    "get_conversation": lambda message_data, conversation_id, websocket, manager:
+        handle_get_conversation(conversation_id, websocket, manager),
+}
@@ -377,32 +377,14 @@ createApp({
                     });
                     break;
 
-                case 'goals_inferred': {
-                    const last = messages.value[messages.value.length - 1];
-                    if (last?.role === 'user') last.goals = data.goals;
-                    goals.value.push(...data.goals);
-                    if (data.message_id) {
-                        messageGoalMap.value[data.message_id] = [...data.goals];
-                    }
-                    updateTimelineInference(data.goals);
+                case 'goals_inferred':
+                    applyInferredGoals(data.goals, data.message_id);
                     break;
-                }
 
-                case 'goals_updated':
-                    goals.value = [...data.goals];
-                    messages.value.forEach(msg => {
-                        if (msg.role === 'user') {
-                            const msgGoals = data.goals.filter(g => g.source_message_id === msg.id);
-                            msg.goals = msgGoals;
-                            if (msgGoals.length > 0) {
-                                messageGoalMap.value[msg.id] = msgGoals;
-                            } else {
-                                delete messageGoalMap.value[msg.id];
-                            }
-                        }
-                    });
-                    fetchGoalHistory();
-                    updateTimelineMerge(data);
+                // Inference and merge results of one turn, coalesced into a single frame
+                case 'goals_ready':
+                    applyInferredGoals(data.inferred, data.message_id);
+                    applyMergedGoals(data);
                     break;
 
                 case 'goals_evaluated':
@@ -445,7 +427,9 @@ createApp({
                 case 'llm_response_complete':
                     isStreaming.value = false;
                     const final = messages.value.find(m => m.id === data.message_id);
-                    if (final) final.content = data.full_text;
+                    if (final && streamingMessage.value.id === data.message_id) {
+                        final.content = streamingMessage.value.content;
+                    }
                     break;
 
                 case 'keyphrases_extracted':
@@ -554,6 +538,33 @@ createApp({
         };
 
         // --- Timeline ---
+        const applyInferredGoals = (inferredGoals, messageId) => {
+            const last = messages.value[messages.value.length - 1];
+            if (last?.role === 'user') last.goals = inferredGoals;
+            goals.value.push(...inferredGoals);
+            if (messageId) {
+                messageGoalMap.value[messageId] = [...inferredGoals];
+            }
+            updateTimelineInference(inferredGoals);
+        };
+
+        const applyMergedGoals = (mergeData) => {
+            goals.value = [...mergeData.goals];
+            messages.value.forEach(msg => {
+                if (msg.role === 'user') {
+                    const msgGoals = mergeData.goals.filter(g => g.source_message_id === msg.id);
+                    msg.goals = msgGoals;
+                    if (msgGoals.length > 0) {
+                        messageGoalMap.value[msg.id] = msgGoals;
+                    } else {
+                        delete messageGoalMap.value[msg.id];
+                    }
+                }
+            });
+            fetchGoalHistory();
+            updateTimelineMerge(mergeData);
+        };
+
         const updateTimelineInference = (inferredGoals) => {
             const turnNum = Math.ceil(messages.value.filter(m => m.role === 'user').length);
             let turn = timelineData.value.find(t => t.turnNumber === turnNum);
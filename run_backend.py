@@ -4,15 +4,28 @@ OnGoal Backend Runner
 Development server script for the OnGoal backend
 """
 
+import importlib.util
 import os
 import sys
-import uvicorn
 from pathlib import Path
 
 # Add backend directory to Python path
 backend_dir = Path(__file__).parent / "backend"
 sys.path.insert(0, str(backend_dir))
 
+def fast_server_options():
+    """Use uvloop and httptools when installed (uvicorn[standard] ships both on POSIX).
+
+    The WebSocket path is send-heavy, and libuv's event loop cuts per-send overhead.
+    Falls back to uvicorn's defaults where they are unavailable, e.g. on Windows.
+    """
+    options = {}
+    if importlib.util.find_spec("uvloop"):
+        options["loop"] = "uvloop"
+    if importlib.util.find_spec("httptools"):
+        options["http"] = "httptools"
+    return options
+
 def main():
     """Run the OnGoal backend server"""
     
@@ -31,17 +44,20 @@ def main():
     print("❤️  Health Check: http://localhost:8000/api/health")
     print()
     
+    # Deferred until the .env check passes so a misconfigured start exits
+    # without paying for uvicorn's import
+    import uvicorn
+
     try:
-        # Import and run the FastAPI app
-        from main import app
-        
+        # reload=True requires the app as an import string
         uvicorn.run(
-            app,
+            "backend.main:app",
             host="0.0.0.0",
             port=8000,
             reload=True,
             reload_dirs=[str(backend_dir)],
-            log_level="info"
+            log_level="info",
+            **fast_server_options()
         )
         
     except KeyboardInterrupt:
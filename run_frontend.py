@@ -7,7 +7,6 @@ Simple HTTP server for serving the Vue.js frontend during development
 import os
 import sys
 import http.server
-import socketserver
 from pathlib import Path
 
 def main():
@@ -45,7 +44,9 @@ def main():
                 # Custom log format
                 print(f"📡 {self.address_string()} - {format % args}")
         
-        with socketserver.TCPServer((HOST, PORT), NoCacheHTTPRequestHandler) as httpd:
+        # One thread per request so the browser's parallel asset fetches
+        # aren't served one at a time; daemon threads exit with Ctrl+C
+        with http.server.ThreadingHTTPServer((HOST, PORT), NoCacheHTTPRequestHandler) as httpd:
             print(f"✅ Frontend server running at http://{HOST}:{PORT}")
             print("Press Ctrl+C to stop")
             httpd.serve_forever()
@@ -4,12 +4,11 @@ OnGoal Unified Test Runner
 Replaces all shell script runners with a single, efficient test execution system
 """
 
+import os
 import subprocess
 import sys
 import argparse
-import json
 import time
-from datetime import datetime
 from pathlib import Path
 
 
@@ -35,7 +34,7 @@ class OnGoalTestRunner:
         if verbose:
             cmd.append("-v")
 
-        return self._execute_tests(cmd, "Unit Tests")
+        return self._execute_tests(cmd, "Unit Tests", in_process=True)
 
     def run_backend_tests(self, verbose=True):
         """Run backend API tests (backend server only)"""
@@ -53,7 +52,7 @@ class OnGoalTestRunner:
         if verbose:
             cmd.append("-v")
 
-        return self._execute_tests(cmd, "Backend Tests")
+        return self._execute_tests(cmd, "Backend Tests", in_process=True)
 
     def run_browser_tests(self, verbose=True, visible=False):
         """Run browser automation tests (both servers)"""
@@ -91,13 +90,20 @@ class OnGoalTestRunner:
         if verbose:
             cmd.append("-v")
 
-        return self._execute_tests(cmd, "Integration Tests")
+        return self._execute_tests(cmd, "Integration Tests", in_process=True)
 
     def run_regression_suite(self, verbose=True, visible=False):
         """Optimized regression: fast tests in parallel, slow/LLM tests in serial"""
         print("🎯 RUNNING OPTIMIZED REGRESSION SUITE")
         print("=" * 50)
 
+        # Collecting the slow tests needs no server, so overlap it with Phase 1.
+        # Running the slow tests themselves alongside would fight over port 8000.
+        slow_collection = subprocess.Popen(
+            [self.venv_python, "-m", "pytest", "--collect-only", "tests/backend/", "-m", "slow", "-q"],
+            cwd=self.project_root, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True
+        )
+
         # Phase 1: Fast tests in parallel with xdist
         print("\n🚀 Phase 1: Fast tests (parallel)")
         print("-" * 40)
@@ -105,6 +111,7 @@ class OnGoalTestRunner:
             self.venv_python, "-m", "pytest",
             "tests/backend/",
             "-m", "not slow",
+            "--run-integration",
             "--tb=short",
             "-n", "auto", "--dist=loadscope"
         ]
@@ -113,11 +120,8 @@ class OnGoalTestRunner:
         fast_ok = self._execute_tests(fast_cmd, "Fast Tests")
 
         # Phase 2: Check if slow tests exist
-        slow_result = subprocess.run(
-            [self.venv_python, "-m", "pytest", "--collect-only", "tests/backend/", "-m", "slow", "-q"],
-            capture_output=True, text=True
-        )
-        if "collected 0 items" in slow_result.stdout or slow_result.returncode != 0:
+        slow_stdout, _ = slow_collection.communicate()
+        if "collected 0 items" in slow_stdout or slow_collection.returncode != 0:
             print("\n📋 No slow tests found — regression complete")
             self._print_regression_summary({"Fast Tests": fast_ok}, fast_ok)
             return fast_ok
@@ -129,6 +133,7 @@ class OnGoalTestRunner:
             self.venv_python, "-m", "pytest",
             "tests/backend/",
             "-m", "slow",
+            "--run-integration",
             "--tb=short",
             "-n", "1"
         ]
@@ -157,19 +162,28 @@ class OnGoalTestRunner:
         if verbose:
             cmd.append("-v")
 
-        return self._execute_tests(cmd, "Smoke Tests")
+        return self._execute_tests(cmd, "Smoke Tests", in_process=True)
+
+    def _execute_tests(self, cmd, test_type, in_process=False):
+        """Execute pytest command and return success status.
 
-    def _execute_tests(self, cmd, test_type):
-        """Execute pytest command and return success status"""
+        With *in_process*, a run that would use the interpreter we are already
+        running under calls pytest.main() directly and skips a second
+        interpreter + pytest startup. Only single-category runs opt in: pytest
+        caches imported test modules, so one process must not run it twice.
+        """
         print(f"🚀 Command: {' '.join(cmd)}")
         print()
 
         start_time = time.time()
 
         try:
-            result = subprocess.run(cmd, cwd=self.project_root)
+            if in_process and self._running_in_project_venv():
+                returncode = self._run_pytest_in_process(cmd[3:])
+            else:
+                returncode = subprocess.run(cmd, cwd=self.project_root).returncode
             duration = time.time() - start_time
-            success = result.returncode == 0
+            success = returncode == 0
 
             print(f"\n⏱️  {test_type} completed in {duration:.2f} seconds")
             return success
@@ -178,6 +192,22 @@ class OnGoalTestRunner:
             print(f"❌ Failed to execute {test_type}: {e}")
             return False
 
+    def _running_in_project_venv(self):
+        """True when this process already runs on the interpreter the commands target."""
+        return Path(sys.prefix).resolve() == (self.project_root / ".venv").resolve()
+
+    def _run_pytest_in_process(self, args):
+        """Run pytest in this process from the project root; returns its exit code."""
+        # Imported here: the runner itself may be launched outside the venv
+        import pytest
+
+        original_cwd = os.getcwd()
+        os.chdir(self.project_root)
+        try:
+            return int(pytest.main(args))
+        finally:
+            os.chdir(original_cwd)
+
     def _print_regression_summary(self, results, overall_success):
         """Print regression test summary"""
         print("\n" + "=" * 50)
@@ -4,8 +4,15 @@ Basic tests for LLM-based assertion system
 Verify that the LLM assertion helpers work correctly before using them in complex tests.
 """
 
+import logging
+
 import pytest
-from tests.utils.llm_assertion_helpers import get_llm_assert
+from unittest.mock import AsyncMock
+
+from tests.utils.llm_assertion_helpers import LLM_ASSERT_MODE_ENV, LLMAssertionHelper, get_llm_assert
+from tests.utils.llm_verdict_cache import VerdictCache
+
+logger = logging.getLogger(__name__)
 
 
 @pytest.mark.integration
@@ -27,7 +34,7 @@ class TestLLMAssertions:
             context="Testing basic semantic matching"
         )
 
-        print(f"🤖 LLM Result: {result}")
+        logger.debug("LLM result: %s", result)
 
         # Structural fallback: exact text match is sufficient proof
         structural_match = any("shorter" in g["text"].lower() for g in test_goals)
@@ -51,7 +58,7 @@ class TestLLMAssertions:
             context="Testing basic semantic non-matching"
         )
         
-        print(f"🤖 LLM Result: {result}")
+        logger.debug("LLM result: %s", result)
         
         assert not result.passed or (not any("shorter" in g["text"].lower() or "reduce" in g["text"].lower() for g in test_goals)), \
             f"Should reject non-matching goals: {result.reason}"
@@ -72,7 +79,7 @@ class TestLLMAssertions:
             context="Testing paraphrase recognition"
         )
 
-        print(f"🤖 LLM Result: {result}")
+        logger.debug("LLM result: %s", result)
 
         # Structural fallback: "reduce the length" ≈ "make shorter"
         structural_match = any("reduce" in g["text"].lower() or "shorter" in g["text"].lower() for g in test_goals)
@@ -104,10 +111,132 @@ class TestLLMAssertions:
             target_concept="make the story shorter"
         )
 
-        print(f"🤖 LLM Result: {result}")
+        logger.debug("LLM result: %s", result)
 
         # Structural fallback: "shorter" is literally in the merged goal text
         structural_match = any("shorter" in g["text"].lower() for g in merged_goals)
         assert result.passed or structural_match, (
             f"Should recognize concept preservation in merge: {result.reason}"
         )
+
+
+@pytest.mark.asyncio
+async def test_should_reuse_cached_verdict_for_identical_judge_prompt(tmp_path):
+    """
+    GIVEN: A judge verdict for a prompt was already parsed and persisted
+    WHEN: The same assertion is made again, including from a fresh cache on disk
+    THEN: The judge LLM is asked only once and the verdict is replayed
+    """
+    cache_path = tmp_path / "verdicts.json"
+    helper = LLMAssertionHelper(verdict_cache=VerdictCache(cache_path))
+    helper._ask_llm = AsyncMock(return_value='{"passed": true, "reason": "match", "confidence": "high"}')
+    goals = [{"text": "Please make the story shorter", "type": "request"}]
+
+    first = await helper.assert_goal_semantic_match(goals=goals, expected_concept="shorter story")
+    second = await helper.assert_goal_semantic_match(goals=goals, expected_concept="shorter story")
+    helper.verdict_cache.save()
+    rerun = LLMAssertionHelper(verdict_cache=VerdictCache(cache_path))
+    rerun._ask_llm = AsyncMock()
+    replayed = await rerun.assert_goal_semantic_match(goals=goals, expected_concept="shorter story")
+
+    assert helper._ask_llm.await_count == 1
+    rerun._ask_llm.assert_not_awaited()
+    assert (first.passed, second.passed, replayed.passed) == (True, True, True)
+    assert replayed.reason == first.reason == "match"
+
+
+@pytest.mark.asyncio
+async def test_should_not_cache_failed_or_unparsed_verdicts():
+    """
+    GIVEN: A judge that first fails the assertion, then replies without a verdict
+    WHEN: The same assertion is made again after each reply
+    THEN: Neither reply is cached, so the judge is asked every time
+    """
+    helper = LLMAssertionHelper(verdict_cache=VerdictCache())
+    helper._ask_llm = AsyncMock(side_effect=[
+        '{"passed": false, "reason": "flaky"}',
+        '{"reason": "truncated"}',
+        '{"passed": true, "reason": "match"}',
+    ])
+    goals = [{"text": "Please make the story shorter", "type": "request"}]
+
+    results = [await helper.assert_goal_semantic_match(goals=goals, expected_concept="shorter story")
+               for _ in range(4)]
+
+    assert helper._ask_llm.await_count == 3
+    assert [r.passed for r in results] == [False, False, True, True]
+
+
+def test_should_share_verdict_key_across_whitespace_variants_only():
+    """
+    GIVEN: Judge prompts that differ only in spacing, or only in letter case
+    WHEN: Their cache keys are computed for the same model
+    THEN: Spacing variants share a key, while case, concept or model changes do not
+    """
+    key = VerdictCache.key("gemma", 'EXPECTED CONCEPT: "NASA  mission story"\n')
+
+    assert VerdictCache.key("gemma", 'EXPECTED CONCEPT: "NASA mission story"') == key
+    assert VerdictCache.key("gemma", 'EXPECTED CONCEPT: "nasa mission story"') != key
+    assert VerdictCache.key("gemma", 'EXPECTED CONCEPT: "long detailed story"') != key
+    assert VerdictCache.key("llama", 'EXPECTED CONCEPT: "NASA  mission story"') != key
+
+
+@pytest.mark.asyncio
+async def test_should_judge_several_concepts_in_one_batched_call():
+    """
+    GIVEN: Three concepts to check against the same goals
+    WHEN: They are judged as a batch, once with a reordered reply and once with a duplicated id
+    THEN: Verdicts are matched by echoed id; an unmatched reply falls back to per-concept calls
+    """
+    goals = [{"text": "Write a short funny story", "type": "request"}]
+    concepts = ["short story", "humor", "space setting"]
+    batch_reply = ('{"results": [{"id": 3, "passed": false, "reason": "c"}, {"id": 1, "passed": true, "reason": "a"},'
+                   ' {"id": 2, "passed": true, "reason": "b"}]}')
+    helper = LLMAssertionHelper(verdict_cache=VerdictCache())
+    helper._ask_llm = AsyncMock(return_value=batch_reply)
+
+    results = await helper.assert_goals_semantic_match_batch(goals=goals, expected_concepts=concepts)
+
+    assert helper._ask_llm.await_count == 1
+    assert [(r.passed, r.reason) for r in results] == [(True, "a"), (True, "b"), (False, "c")]
+
+    fallback = LLMAssertionHelper(verdict_cache=VerdictCache())
+    fallback._ask_llm = AsyncMock(side_effect=[
+        '{"results": [{"id": 1, "passed": true}, {"id": 1, "passed": true}, {"id": 2, "passed": true}]}',
+    ] + ['{"passed": true, "reason": "single"}'] * 3)
+
+    results = await fallback.assert_goals_semantic_match_batch(goals=goals, expected_concepts=concepts)
+
+    assert fallback._ask_llm.await_count == 4
+    assert [r.reason for r in results] == ["single"] * 3
+
+
+def test_should_reject_batch_replies_with_missing_or_duplicate_ids():
+    """
+    GIVEN: Batched judge replies that drop, repeat or invent a concept id
+    WHEN: They are matched against the expected concepts
+    THEN: Matching fails explicitly instead of assigning verdicts by position
+    """
+    for results in ([{"id": 1}, {"id": 2}], [{"id": 1}, {"id": 1}, {"id": 3}], [{"id": 1}, {"id": 2}, {"id": 4}]):
+        with pytest.raises(ValueError):
+            LLMAssertionHelper._match_batch_results(results, 3)
+
+
+@pytest.mark.asyncio
+async def test_should_check_concepts_by_substring_in_fast_mode(monkeypatch):
+    """
+    GIVEN: ONGOAL_LLM_ASSERT_MODE is set to "fast"
+    WHEN: Single and batched semantic assertions are made
+    THEN: Concepts are matched case-insensitively by substring and the judge LLM is never asked
+    """
+    monkeypatch.setenv(LLM_ASSERT_MODE_ENV, "fast")
+    helper = LLMAssertionHelper(verdict_cache=VerdictCache())
+    helper._ask_llm = AsyncMock()
+    goals = [{"text": "Write a SHORT funny story", "type": "request"}]
+
+    single = await helper.assert_goal_semantic_match(goals=goals, expected_concept="short")
+    batch = await helper.assert_goals_semantic_match_batch(goals=goals, expected_concepts=["funny story", "space"])
+
+    helper._ask_llm.assert_not_awaited()
+    assert (single.passed, single.reason) == (True, "substring")
+    assert [r.passed for r in batch] == [True, False]
@@ -2,6 +2,8 @@
 Test ConnectionManager broadcast and connections list.
 """
 
+import json
+
 import pytest
 from backend.connection_manager import ConnectionManager
 
@@ -35,8 +37,31 @@ class TestConnectionManagerBroadcast:
         await manager.connect(ws2)
         await manager.broadcast({"test": "data"})
         assert len(ws1.sent) == 1
-        assert ws1.sent[0] == '{"test": "data"}'
+        assert json.loads(ws1.sent[0]) == {"test": "data"}
         assert len(ws2.sent) == 1
+        assert ws2.sent[0] == ws1.sent[0]
+
+    @pytest.mark.asyncio
+    async def test_should_prune_failed_connections_after_broadcast(self, manager, mock_ws):
+        class BrokenWS(type(mock_ws)):
+            async def send_text(self, msg):
+                raise RuntimeError("Connection lost")
+
+        healthy = mock_ws
+        broken = BrokenWS()
+        await manager.connect(broken)
+        await manager.connect(healthy)
+        await manager.broadcast({"type": "ping"})
+        assert len(healthy.sent) == 1
+        assert manager.get_connections() == [healthy]
+
+    @pytest.mark.asyncio
+    async def test_should_serialize_pydantic_models_inside_messages(self, manager, mock_ws):
+        from backend.models import Goal
+        goal = Goal(id="G0", text="Write a story", type="request", source_message_id="msg_0")
+        await manager.send_message({"type": "goals_inferred", "goals": [goal]}, mock_ws)
+        sent = json.loads(mock_ws.sent[0])
+        assert sent["goals"][0] == goal.model_dump(mode="json")
 
     def test_should_return_empty_list_when_no_connections(self, manager):
         assert manager.get_connections() == []
@@ -9,8 +9,10 @@ Verifies that the merge stage correctly implements the three operations:
 All tests use mocked LLM responses for deterministic execution.
 """
 
-import pytest
+import asyncio
 from datetime import datetime
+
+import pytest
 from unittest.mock import patch, AsyncMock
 from backend.pipelines import infer_goals, merge_goals
 from backend.models import Goal
@@ -73,190 +75,92 @@ USER_SCENARIO_MERGE = {
 }
 
 
-@pytest.mark.integration
-class TestMergeOperationsCompliance:
-
-    @pytest.mark.asyncio
-    async def test_should_replace_explicitly_contradicting_goals(self):
-        old_goals = [
-            Goal(
-                id="G0_old",
-                text="Write a long detailed story with many chapters",
-                type="request",
-                source_message_id="msg_1",
-                created_at=datetime.now().isoformat()
-            ),
-            Goal(
-                id="G1_old",
-                text="Include complex character backstories",
-                type="suggestion",
-                source_message_id="msg_1",
-                created_at=datetime.now().isoformat()
-            )
-        ]
-
-        new_goals = [
-            Goal(
-                id="G0_new",
-                text="Write a very short, simple story with minimal details",
-                type="request",
-                source_message_id="msg_2",
-                created_at=datetime.now().isoformat()
-            )
-        ]
-
-        with patch("backend.pipelines.goal_merge.call_llm_json", new_callable=AsyncMock, return_value=REPLACE_MERGE_RESPONSE):
-            merged_goals = await merge_goals(old_goals, new_goals)
-
-        merged_texts = [g.text.lower() for g in merged_goals]
-
-        assert any("short" in text for text in merged_texts), \
-            f"Replace should favor new contradicting goal (short over long): {merged_texts}"
-
-        assert len(merged_goals) <= len(old_goals) + len(new_goals), \
-            "Replace should not just accumulate all goals"
-
-    @pytest.mark.asyncio
-    async def test_should_combine_similar_goals_correctly(self):
-        old_goals = [
-            Goal(
-                id="G0_old",
-                text="Add character development to the story",
-                type="suggestion",
-                source_message_id="msg_1",
-                created_at=datetime.now().isoformat()
-            ),
-            Goal(
-                id="G1_old",
-                text="Include dialogue between characters",
-                type="request",
-                source_message_id="msg_1",
-                created_at=datetime.now().isoformat()
-            )
-        ]
-
-        new_goals = [
-            Goal(
-                id="G0_new",
-                text="Develop the protagonist's background and personality more",
-                type="suggestion",
-                source_message_id="msg_2",
-                created_at=datetime.now().isoformat()
-            )
-        ]
-
-        with patch("backend.pipelines.goal_merge.call_llm_json", new_callable=AsyncMock, return_value=COMBINE_MERGE_RESPONSE):
-            merged_goals = await merge_goals(old_goals, new_goals)
-
-        merged_texts = [g.text.lower() for g in merged_goals]
+# One row per merge operation: goals in, mocked merge reply, and what must survive
+OPERATION_CASES = [
+    {
+        "operation": "replace",
+        "old": [("G0_old", "Write a long detailed story with many chapters", "request"),
+                ("G1_old", "Include complex character backstories", "suggestion")],
+        "new": [("G0_new", "Write a very short, simple story with minimal details", "request")],
+        "response": REPLACE_MERGE_RESPONSE,
+        "expected_concepts": {"the new contradicting goal (short over long)": ("short",)},
+        # Replace must not just accumulate all goals
+        "count_range": (1, 3),
+    },
+    {
+        "operation": "combine",
+        "old": [("G0_old", "Add character development to the story", "suggestion"),
+                ("G1_old", "Include dialogue between characters", "request")],
+        "new": [("G0_new", "Develop the protagonist's background and personality more", "suggestion")],
+        "response": COMBINE_MERGE_RESPONSE,
+        "expected_concepts": {"similar character concepts": ("character", "protagonist"),
+                              "the dialogue goal": ("dialogue",)},
+        "count_range": (1, 3),
+    },
+    {
+        "operation": "keep",
+        "old": [("G0_old", "Add humor to make the story entertaining", "suggestion"),
+                ("G1_old", "Set the story in a futuristic space station", "request")],
+        "new": [("G0_new", "Include technical details about spaceship engines", "suggestion"),
+                ("G1_new", "Add a romantic subplot between crew members", "offer")],
+        "response": KEEP_MERGE_RESPONSE,
+        "expected_concepts": {"the humor goal": ("humor",), "the space station goal": ("space",),
+                              "the spaceship goal": ("spaceship", "engine", "technical")},
+        # Keep should preserve most unique concepts
+        "count_range": (3, 4),
+    },
+]
+
+
+@pytest.fixture
+def now_iso():
+    """One creation timestamp shared by every goal a test builds"""
+    return datetime.now().isoformat()
+
+
+def _mk_goals(source_message_id, created_at, *rows):
+    """Build goals from (id, text, type) rows that share a source message and timestamp"""
+    return [
+        Goal(id=goal_id, text=text, type=goal_type, source_message_id=source_message_id, created_at=created_at)
+        for goal_id, text, goal_type in rows
+    ]
 
-        assert any("character" in text or "protagonist" in text for text in merged_texts), \
-            f"Combine should merge similar character concepts: {merged_texts}"
 
-        assert any("dialogue" in text for text in merged_texts), \
-            f"Keep should preserve dialogue goal: {merged_texts}"
+@pytest.mark.unit
+class TestMergeOperationsCompliance:
 
     @pytest.mark.asyncio
-    async def test_should_keep_unique_goals_unchanged(self):
-        old_goals = [
-            Goal(
-                id="G0_old",
-                text="Add humor to make the story entertaining",
-                type="suggestion",
-                source_message_id="msg_1",
-                created_at=datetime.now().isoformat()
-            ),
-            Goal(
-                id="G1_old",
-                text="Set the story in a futuristic space station",
-                type="request",
-                source_message_id="msg_1",
-                created_at=datetime.now().isoformat()
-            )
-        ]
-
-        new_goals = [
-            Goal(
-                id="G0_new",
-                text="Include technical details about spaceship engines",
-                type="suggestion",
-                source_message_id="msg_2",
-                created_at=datetime.now().isoformat()
-            ),
-            Goal(
-                id="G1_new",
-                text="Add a romantic subplot between crew members",
-                type="offer",
-                source_message_id="msg_2",
-                created_at=datetime.now().isoformat()
-            )
-        ]
+    @pytest.mark.parametrize("case", OPERATION_CASES, ids=[case["operation"] for case in OPERATION_CASES])
+    async def test_should_apply_single_merge_operation(self, now_iso, case):
+        old_goals = _mk_goals("msg_1", now_iso, *case["old"])
+        new_goals = _mk_goals("msg_2", now_iso, *case["new"])
 
-        with patch("backend.pipelines.goal_merge.call_llm_json", new_callable=AsyncMock, return_value=KEEP_MERGE_RESPONSE):
+        with patch("backend.pipelines.goal_merge.call_llm_json", new_callable=AsyncMock, return_value=case["response"]):
             merged_goals = await merge_goals(old_goals, new_goals)
 
         merged_texts = [g.text.lower() for g in merged_goals]
 
-        assert any("humor" in text for text in merged_texts), \
-            f"Keep should preserve humor goal: {merged_texts}"
-
-        assert any("space" in text for text in merged_texts), \
-            f"Keep should preserve space station goal: {merged_texts}"
-
-        assert any("spaceship" in text or "engine" in text or "technical" in text for text in merged_texts), \
-            f"Keep should preserve spaceship goal: {merged_texts}"
+        for concept, keywords in case["expected_concepts"].items():
+            assert any(keyword in text for text in merged_texts for keyword in keywords), \
+                f"{case['operation'].capitalize()} should preserve {concept}: {merged_texts}"
 
-        assert len(merged_goals) >= 3, f"Keep should preserve most unique concepts, got {len(merged_goals)}"
+        min_count, max_count = case["count_range"]
+        assert min_count <= len(merged_goals) <= max_count, \
+            f"{case['operation'].capitalize()} produced {len(merged_goals)} goals, expected {min_count}-{max_count}"
 
     @pytest.mark.asyncio
-    async def test_should_handle_mixed_operations_scenario(self):
-        old_goals = [
-            Goal(
-                id="G0_old",
-                text="Write a long, detailed story about space exploration",
-                type="request",
-                source_message_id="msg_1",
-                created_at=datetime.now().isoformat()
-            ),
-            Goal(
-                id="G1_old",
-                text="Make the protagonist a relatable teenager",
-                type="suggestion",
-                source_message_id="msg_1",
-                created_at=datetime.now().isoformat()
-            ),
-            Goal(
-                id="G2_old",
-                text="Add humor to keep it engaging",
-                type="suggestion",
-                source_message_id="msg_1",
-                created_at=datetime.now().isoformat()
-            )
-        ]
-
-        new_goals = [
-            Goal(
-                id="G0_new",
-                text="Make the story much shorter and concise",
-                type="request",
-                source_message_id="msg_2",
-                created_at=datetime.now().isoformat()
-            ),
-            Goal(
-                id="G1_new",
-                text="Ensure the main character faces realistic challenges for teens",
-                type="suggestion",
-                source_message_id="msg_2",
-                created_at=datetime.now().isoformat()
-            ),
-            Goal(
-                id="G2_new",
-                text="Include technical accuracy about space travel",
-                type="request",
-                source_message_id="msg_2",
-                created_at=datetime.now().isoformat()
-            )
-        ]
+    async def test_should_handle_mixed_operations_scenario(self, now_iso):
+        old_goals = _mk_goals("msg_1", now_iso,
+            ("G0_old", "Write a long, detailed story about space exploration", "request"),
+            ("G1_old", "Make the protagonist a relatable teenager", "suggestion"),
+            ("G2_old", "Add humor to keep it engaging", "suggestion"),
+        )
+
+        new_goals = _mk_goals("msg_2", now_iso,
+            ("G0_new", "Make the story much shorter and concise", "request"),
+            ("G1_new", "Ensure the main character faces realistic challenges for teens", "suggestion"),
+            ("G2_new", "Include technical accuracy about space travel", "request"),
+        )
 
         with patch("backend.pipelines.goal_merge.call_llm_json", new_callable=AsyncMock, return_value=MIXED_MERGE_RESPONSE):
             merged_goals = await merge_goals(old_goals, new_goals)
@@ -283,18 +187,17 @@ class TestMergeOperationsCompliance:
 
         followup_message = "Please make the story shorter."
 
-        call_count = 0
-
+        # Keyed on the prompt rather than call order, since both inferences run concurrently
         async def mock_infer_llm(prompt, max_tokens=1000, label=""):
-            nonlocal call_count
-            call_count += 1
-            return INFER_INITIAL_STORY if call_count == 1 else INFER_FOLLOWUP_SHORTER
+            return INFER_FOLLOWUP_SHORTER if prompt.endswith(followup_message) else INFER_INITIAL_STORY
 
         with patch("backend.pipelines.goal_inference.call_llm_json", side_effect=mock_infer_llm), \
              patch("backend.pipelines.goal_merge.call_llm_json", new_callable=AsyncMock, return_value=USER_SCENARIO_MERGE):
 
-            initial_goals = await infer_goals(initial_message, "msg_1")
-            followup_goals = await infer_goals(followup_message, "msg_2")
+            initial_goals, followup_goals = await asyncio.gather(
+                infer_goals(initial_message, "msg_1"),
+                infer_goals(followup_message, "msg_2"),
+            )
             merged_goals = await merge_goals(initial_goals, followup_goals)
 
         assert len(initial_goals) > 0, "Should infer initial goals"
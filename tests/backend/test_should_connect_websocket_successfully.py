@@ -3,62 +3,64 @@ Simple WebSocket test to debug connection issues
 This tests WebSocket functionality directly without browser complexity
 """
 
-import asyncio
 import json
-import websockets
+import logging
+
 import pytest
+from unittest.mock import AsyncMock
+
+from backend.connection_manager import ConnectionManager
+from backend.websocket_handlers import handle_websocket_connection
+
+logger = logging.getLogger(__name__)
 
 
-@pytest.mark.asyncio
 @pytest.mark.integration
-async def test_should_connect_to_websocket_directly(backend_server):
+def test_should_connect_to_websocket_directly(websocket_first_reply):
     """Test direct WebSocket connection to backend (requires running server)"""
-    
-    try:
-        # Connect to WebSocket endpoint
-        ws_url = "http://localhost:8000".replace("http://", "ws://").replace("https://", "wss://")
-        uri = f"{ws_url}/ws"
-        print(f"🔗 Attempting direct WebSocket connection to {uri}")
-
-        # Backend URL fixture ensures backend is running
-        # No additional health check needed
-            
-        async with websockets.connect(uri) as websocket:
-            print("✅ WebSocket connected successfully")
-            
-            # Send a test message
-            test_message = {
-                "type": "user_message",
-                "message": "What is the capital of France?"
-            }
-            
-            await websocket.send(json.dumps(test_message))
-            print(f"📤 Sent test message: {test_message}")
-            
-            # Wait for response
-            try:
-                response = await asyncio.wait_for(websocket.recv(), timeout=10.0)
-                response_data = json.loads(response)
-                print(f"📨 Received response: {response_data}")
-                
-                # Check if goals were inferred
-                if response_data.get("type") == "goals_inferred":
-                    goals = response_data.get("goals", [])
-                    print(f"🎯 Goals inferred: {len(goals)} goals")
-                    for goal in goals:
-                        print(f"  - {goal['type']}: {goal['text']}")
-                    
-                    assert len(goals) > 0, "Should have inferred at least one goal"
-                    assert any(goal.get('type') in ('question', 'request', 'suggestion', 'offer') for goal in goals), \
-                        "Should have inferred a valid goal type"
-                    
-                else:
-                    print(f"❌ Expected goals_inferred, got: {response_data.get('type')}")
-                    
-            except asyncio.TimeoutError:
-                print("⏱️ Timeout waiting for WebSocket response")
-                raise AssertionError("No response received from WebSocket")
-                
-    except Exception as e:
-        print(f"❌ WebSocket connection failed: {e}")
-        raise
+    assert websocket_first_reply is not None, "No response received from WebSocket"
+
+    # Check if goals were inferred
+    if websocket_first_reply.get("type") == "goals_inferred":
+        goals = websocket_first_reply.get("goals", [])
+        logger.debug("Goals inferred: %d goals", len(goals))
+
+        assert len(goals) > 0, "Should have inferred at least one goal"
+        assert any(goal.get('type') in ('question', 'request', 'suggestion', 'offer') for goal in goals), \
+            "Should have inferred a valid goal type"
+    else:
+        logger.warning("Expected goals_inferred, got: %s", websocket_first_reply.get("type"))
+
+
+@pytest.mark.asyncio
+async def test_should_decode_frames_and_drop_connection_on_malformed_json():
+    """Inbound frames are decoded and dispatched; a malformed frame ends the connection"""
+    manager = ConnectionManager()
+    websocket = AsyncMock()
+    websocket.receive_text.side_effect = [
+        json.dumps({"type": "toggle_pipeline", "stage": "merge", "enabled": True}),
+        "{not json",
+    ]
+
+    await handle_websocket_connection(websocket, manager, "test_decode_frames")
+
+    sent = json.loads(websocket.send_text.await_args_list[0].args[0])
+    assert sent == {"type": "pipeline_toggled", "stage": "merge", "enabled": True}
+    assert manager.get_connections() == []
+
+
+@pytest.mark.asyncio
+async def test_should_ignore_unknown_message_types():
+    """Frames with an unknown type are skipped without closing the connection"""
+    manager = ConnectionManager()
+    websocket = AsyncMock()
+    websocket.receive_text.side_effect = [
+        json.dumps({"type": "no_such_type"}),
+        json.dumps({"type": "get_conversation"}),
+        "{not json",
+    ]
+
+    await handle_websocket_connection(websocket, manager, "test_unknown_type")
+
+    sent = [json.loads(call.args[0]) for call in websocket.send_text.await_args_list]
+    assert [frame["type"] for frame in sent] == ["conversation_state"]
@@ -1,7 +1,9 @@
+import asyncio
+
 import pytest
 from unittest.mock import patch, AsyncMock
 from backend.models import Goal
-from backend.pipelines.goal_evaluation import evaluate_goal
+from backend.pipelines.goal_evaluation import evaluate_goal, evaluate_goals_batch
 
 
 @pytest.mark.asyncio
@@ -15,3 +17,27 @@ async def test_should_evaluate_goal_from_new_module():
 
     assert result["category"] == "confirm"
     assert result["goal_id"] == "G0"
+
+
+@pytest.mark.asyncio
+async def test_should_evaluate_goals_concurrently_in_order():
+    in_flight = 0
+    peak_in_flight = 0
+
+    async def fake_generate(prompt, max_tokens=1000):
+        nonlocal in_flight, peak_in_flight
+        in_flight += 1
+        peak_in_flight = max(peak_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return '{"category": "confirm", "explanation": "ok", "examples": []}'
+
+    mock_provider = AsyncMock()
+    mock_provider.generate.side_effect = fake_generate
+    goals = [Goal(id=f"G{i}", text=f"goal {i}", type="request", source_message_id="msg_0") for i in range(4)]
+    with patch('backend.llm_provider.get_provider', return_value=mock_provider):
+        results = await evaluate_goals_batch(goals, "Here is a story...", max_concurrency=2)
+
+    assert [r["goal_id"] for r in results] == ["G0", "G1", "G2", "G3"]
+    assert all(goal.status == "confirm" for goal in goals)
+    assert peak_in_flight == 2
@@ -46,6 +46,12 @@ class TestExtractJsonObject:
         result = extract_json_object(text)
         assert result == {"status": "ok"}
 
+    def test_should_ignore_unbalanced_braces_inside_string_values(self):
+        from backend.json_parser import extract_json_object
+        text = 'Result: {"explanation": "closes early } here", "quote": "say \\"{\\""} and a stray } after'
+        result = extract_json_object(text)
+        assert result == {"explanation": "closes early } here", "quote": 'say "{"'}
+
 
 class TestPipelineFunctionsWithFencedJson:
     """Verify pipeline functions still work when LLM returns markdown-fenced JSON."""
@@ -1,6 +1,11 @@
+import asyncio
+import json
+
 import pytest
 from unittest.mock import patch, AsyncMock, MagicMock
 
+from backend.connection_manager import encode_message
+
 
 def _mock_provider(generate_return=None):
     provider = MagicMock()
@@ -32,6 +37,60 @@ async def test_should_stream_from_new_module():
         result = await stream_llm_response("Hi", mock_mgr, mock_ws, "msg_1", [])
 
     assert result == "Hello world"
+    completion = mock_mgr.send_message.await_args_list[-1].args[0]
+    assert completion == {"type": "llm_response_complete", "message_id": "msg_1"}
+
+
+@pytest.mark.asyncio
+async def test_should_return_partial_stream_when_client_disconnects():
+    from backend.pipelines.llm_streaming import stream_llm_response
+    mock_ws = AsyncMock()
+    mock_mgr = AsyncMock()
+    mock_mgr.send_message = AsyncMock(side_effect=[True, False])
+
+    async def fake_stream(*args, **kwargs):
+        yield "Hello "
+        yield "brave "
+        yield "world"
+
+    mock_provider = MagicMock()
+    mock_provider.is_available.return_value = True
+    mock_provider.generate_stream = fake_stream
+
+    with patch('backend.llm_provider.get_provider', return_value=mock_provider), \
+            patch('backend.pipelines.llm_streaming.STREAM_BATCH_MAX_CHUNKS', 1):
+        result = await stream_llm_response("Hi", mock_mgr, mock_ws, "msg_1", [])
+
+    assert result == "Hello brave "
+    assert mock_mgr.send_message.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_should_batch_stream_chunks_until_size_or_delay_limit():
+    from backend.pipelines.llm_streaming import stream_llm_response
+    mock_mgr = AsyncMock()
+    mock_mgr.send_message = AsyncMock(return_value=True)
+
+    async def fake_stream(*args, **kwargs):
+        for token in ["a", "b", "c", "d", "e"]:
+            yield token
+        await asyncio.sleep(0.1)
+        yield "f"
+
+    mock_provider = MagicMock()
+    mock_provider.is_available.return_value = True
+    mock_provider.generate_stream = fake_stream
+
+    with patch('backend.llm_provider.get_provider', return_value=mock_provider), \
+            patch('backend.pipelines.llm_streaming.STREAM_BATCH_MAX_CHUNKS', 3):
+        result = await stream_llm_response("Hi", mock_mgr, AsyncMock(), "msg_1", [])
+
+    chunk_texts = [
+        call.args[0]["text"] for call in mock_mgr.send_message.await_args_list
+        if call.args[0]["type"] == "llm_response_chunk"
+    ]
+    assert chunk_texts == ["abc", "de", "f"]
+    assert result == "abcdef"
 
 
 @pytest.mark.asyncio
@@ -82,4 +141,110 @@ async def test_should_merge_goals_from_new_module():
         result = merge_goals(old, new, "msg_1")
         result = await result
     assert len(result) == 1
-    assert "good" in result[0].text
\ No newline at end of file
+    assert "good" in result[0].text
+
+
+@pytest.mark.asyncio
+async def test_should_run_alert_detectors_concurrently_in_stable_order():
+    from backend.models import Conversation, Goal
+    from backend.pipeline_orchestrator import _run_detection_alerts
+    conversation = Conversation(id="test")
+    conversation.add_goal(Goal(id="G0", text="Write a story", type="request", source_message_id="msg_0"))
+    running = {"now": 0, "peak": 0}
+
+    def detector(result):
+        async def detect(*args):
+            running["now"] += 1
+            running["peak"] = max(running["peak"], running["now"])
+            await asyncio.sleep(0)
+            running["now"] -= 1
+            return result
+        return detect
+
+    flagged = {"reason": "flagged"}
+    detectors = {
+        "detect_forgetting": detector([{"goal_id": "G0"}]),
+        "detect_contradiction": detector([]),
+        "detect_derailment": detector(flagged),
+        "detect_repetition": detector(None),
+        "detect_fixation": detector(flagged),
+        "detect_breakdown": detector(flagged),
+    }
+    manager = MagicMock()
+    manager.send_message = AsyncMock(return_value=True)
+
+    with patch.multiple('backend.pipeline_orchestrator', **detectors):
+        await _run_detection_alerts(conversation, "response", "msg_1", MagicMock(), manager)
+
+    assert running["peak"] == len(detectors)
+    assert [a.alert_type for a in conversation.alerts] == ["forgetting", "derailment", "fixation", "breakdown"]
+    frame = json.loads(encode_message(manager.send_message.await_args.args[0]))
+    assert frame["alerts"] == [alert.model_dump(mode="json") for alert in conversation.alerts]
+
+
+@pytest.mark.asyncio
+async def test_should_coalesce_inferred_and_merged_goals_into_one_frame():
+    from backend.models import Conversation, Goal, Message
+    from backend.pipeline_orchestrator import _run_inference, _run_merge
+    conversation = Conversation(id="test")
+    conversation.add_goal(Goal(id="G0", text="Write a story", type="request", source_message_id="msg_0"))
+    user_msg = Message(id="msg_1", content="Make it funny", role="user", timestamp="t")
+    conversation.messages.append(user_msg)
+    inferred = [Goal(id="G1", text="Make it funny", type="request", source_message_id="msg_1")]
+    merged = [Goal(id="G0", text="Write a funny story", type="request", source_message_id="msg_1")]
+    manager = MagicMock()
+    manager.send_message = AsyncMock(return_value=True)
+
+    with patch('backend.pipeline_orchestrator.infer_goals', AsyncMock(return_value=inferred)), \
+            patch('backend.pipeline_orchestrator.replace_outdated_goals', AsyncMock(side_effect=lambda goals, *args: goals)), \
+            patch('backend.pipeline_orchestrator.merge_goals', AsyncMock(return_value=merged)):
+        await _run_inference(conversation, user_msg, MagicMock(), manager)
+        await _run_merge(conversation, user_msg, MagicMock(), manager, "2024-01-01T10:00:00")
+
+    frames = [json.loads(encode_message(call.args[0])) for call in manager.send_message.await_args_list]
+    assert [frame["type"] for frame in frames] == ["goals_ready"]
+    assert [g["id"] for g in frames[0]["inferred"]] == ["G1"]
+    assert [g["text"] for g in frames[0]["goals"]] == ["Write a funny story"]
+    assert {entry.timestamp for entry in conversation.goal_history} == {"2024-01-01T10:00:00"}
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("response_text", ["", "   ok   ", "LLM service unavailable - API key not configured"])
+async def test_should_skip_evaluation_for_empty_or_error_responses(response_text):
+    from backend.models import Conversation, Goal
+    from backend.pipeline_orchestrator import _run_evaluation
+    conversation = Conversation(id="test")
+    conversation.add_goal(Goal(id="G0", text="Write a story", type="request", source_message_id="msg_0"))
+    manager = MagicMock()
+    manager.send_message = AsyncMock(return_value=True)
+    batch = AsyncMock(return_value=[])
+
+    with patch('backend.pipeline_orchestrator.evaluate_goals_batch', batch):
+        await _run_evaluation(conversation, response_text, "msg_1", MagicMock(), manager)
+
+    batch.assert_not_awaited()
+    manager.send_message.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_should_skip_merge_llm_calls_when_inferred_goals_restate_existing_ones():
+    from backend.models import Conversation, Goal, Message
+    from backend.pipeline_orchestrator import _run_merge
+    conversation = Conversation(id="test")
+    conversation.add_goal(Goal(id="G0", text="Write a story", type="request", source_message_id="msg_0"))
+    user_msg = Message(id="msg_1", content="write a  STORY", role="user", timestamp="t")
+    user_msg.goals = [Goal(id="G1", text="write a  STORY ", type="request", source_message_id="msg_1")]
+    manager = MagicMock()
+    manager.send_message = AsyncMock(return_value=True)
+    replace, merge = AsyncMock(), AsyncMock()
+
+    with patch('backend.pipeline_orchestrator.replace_outdated_goals', replace), \
+            patch('backend.pipeline_orchestrator.merge_goals', merge):
+        await _run_merge(conversation, user_msg, MagicMock(), manager)
+
+    replace.assert_not_awaited()
+    merge.assert_not_awaited()
+    assert [g.id for g in conversation.goals] == ["G0"]
+    frame = json.loads(encode_message(manager.send_message.await_args.args[0]))
+    assert frame["type"] == "goals_ready"
+    assert [g["id"] for g in frame["goals"]] == ["G0"]
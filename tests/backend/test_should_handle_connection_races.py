@@ -32,7 +32,7 @@ class TestConnectionManagerRaceConditions:
         THEN: It should silently succeed (not raise ValueError)
         """
         # GIVEN
-        manager.active_connections = [mock_ws]
+        manager.active_connections = {mock_ws}
 
         # WHEN - first disconnect
         manager.disconnect(mock_ws)
@@ -45,7 +45,7 @@ class TestConnectionManagerRaceConditions:
             pytest.fail("disconnect() must not raise ValueError on double disconnect")
 
         # THEN
-        assert manager.active_connections == []
+        assert manager.active_connections == set()
 
     @pytest.mark.asyncio
     async def test_should_not_raise_when_send_message_cleans_up_removed_ws(self, manager, mock_ws):
@@ -64,7 +64,7 @@ class TestConnectionManagerRaceConditions:
             pytest.fail("send_message() must not raise ValueError when cleaning up stale websocket")
 
         # THEN
-        assert manager.active_connections == []
+        assert manager.active_connections == set()
 
     @pytest.mark.asyncio
     async def test_should_remove_websocket_on_send_failure(self, manager):
@@ -78,7 +78,7 @@ class TestConnectionManagerRaceConditions:
         bad_ws = MagicMock()
         bad_ws.send_text = MagicMock(side_effect=RuntimeError("Connection lost"))
 
-        manager.active_connections = [good_ws, bad_ws]
+        manager.active_connections = {good_ws, bad_ws}
 
         # WHEN
         await manager.send_message({"type": "test"}, bad_ws)
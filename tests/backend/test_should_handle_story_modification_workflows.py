@@ -9,12 +9,16 @@ Tests the scenario:
 Following TDD: RED -> GREEN -> REFACTOR
 """
 
+import asyncio
+
 import pytest
-from datetime import datetime
 from unittest.mock import patch, AsyncMock
 from backend.pipelines import infer_goals, merge_goals
 from backend.models import Goal
 
+# Timestamps play no part in merging; a constant keeps the goals deterministic
+FIXED_TS = "2024-01-01T10:00:00"
+
 
 INITIAL_STORY_CLAUSES = {
     "clauses": [
@@ -85,29 +89,22 @@ MERGE_FINAL_WITH_HUMOR = {
 }
 
 
-def _make_infer_mock(responses):
-    call_idx = 0
-    responses_list = list(responses)
-
+def _make_infer_mock(responses_by_message):
+    """Answer each inference prompt by the user message it embeds, so call order doesn't matter"""
     async def mock_fn(prompt, max_tokens=1000, label=""):
-        nonlocal call_idx
-        if call_idx < len(responses_list):
-            resp = responses_list[call_idx]
-            call_idx += 1
-            return resp
-        return None
+        return next((resp for message, resp in responses_by_message.items() if prompt.endswith(message)), None)
 
     return mock_fn
 
 
-def _patch_infer_merge(infer_responses, merge_response):
+def _patch_infer_merge(infer_responses_by_message, merge_response):
     return (
-        patch("backend.pipelines.goal_inference.call_llm_json", side_effect=_make_infer_mock(infer_responses)),
+        patch("backend.pipelines.goal_inference.call_llm_json", side_effect=_make_infer_mock(infer_responses_by_message)),
         patch("backend.pipelines.goal_merge.call_llm_json", new_callable=AsyncMock, return_value=merge_response),
     )
 
 
-@pytest.mark.integration
+@pytest.mark.unit
 class TestStoryFollowupGoals:
 
     @pytest.mark.asyncio
@@ -154,21 +151,26 @@ class TestStoryFollowupGoals:
 
     @pytest.mark.asyncio
     async def test_should_handle_story_followup_merge_pipeline(self):
-        infer_mock = _make_infer_mock([INITIAL_STORY_CLAUSES, FOLLOWUP_SHORTER_CLAUSES])
+        initial_message = (
+            "What are the key elements of effective storytelling? "
+            "Please write a creative very SHORT story about space exploration for teenagers. "
+            "I think the protagonist should be relatable and face realistic challenges. "
+            "You should consider adding more humor and interactive elements to make it engaging."
+        )
+        followup_message = "Please make the story shorter."
+        infer_mock = _make_infer_mock({
+            initial_message: INITIAL_STORY_CLAUSES,
+            followup_message: FOLLOWUP_SHORTER_CLAUSES,
+        })
 
         with patch("backend.pipelines.goal_inference.call_llm_json", side_effect=infer_mock), \
              patch("backend.pipelines.goal_merge.call_llm_json", new_callable=AsyncMock, return_value=MERGE_INITIAL_WITH_SHORTER):
 
-            initial_message = (
-                "What are the key elements of effective storytelling? "
-                "Please write a creative very SHORT story about space exploration for teenagers. "
-                "I think the protagonist should be relatable and face realistic challenges. "
-                "You should consider adding more humor and interactive elements to make it engaging."
+            # The two inferences are independent; only the merge needs both
+            initial_goals, followup_goals = await asyncio.gather(
+                infer_goals(initial_message, "msg_1"),
+                infer_goals(followup_message, "msg_2"),
             )
-            followup_message = "Please make the story shorter."
-
-            initial_goals = await infer_goals(initial_message, "msg_1")
-            followup_goals = await infer_goals(followup_message, "msg_2")
             merged_goals = await merge_goals(initial_goals, followup_goals)
 
         assert len(merged_goals) > 0, "Should have merged goals"
@@ -186,31 +188,32 @@ class TestStoryFollowupGoals:
 
     @pytest.mark.asyncio
     async def test_should_handle_story_modification_goals_as_additive(self):
+        # Literal, known-valid goals: construct without running validation
         with patch("backend.pipelines.goal_merge.call_llm_json", new_callable=AsyncMock, return_value=MERGE_ADDITIVE):
             existing_goals = [
-                Goal(
+                Goal.model_construct(
                     id="G0_story",
                     text="Write a creative short story about space exploration for teenagers",
                     type="request",
                     source_message_id="msg_1",
-                    created_at=datetime.now().isoformat()
+                    created_at=FIXED_TS
                 ),
-                Goal(
+                Goal.model_construct(
                     id="G1_relatable",
                     text="Make the protagonist relatable and face realistic challenges",
                     type="suggestion",
                     source_message_id="msg_1",
-                    created_at=datetime.now().isoformat()
+                    created_at=FIXED_TS
                 )
             ]
 
             new_goals = [
-                Goal(
+                Goal.model_construct(
                     id="G2_shorter",
                     text="Make the story shorter",
                     type="request",
                     source_message_id="msg_2",
-                    created_at=datetime.now().isoformat()
+                    created_at=FIXED_TS
                 )
             ]
 
@@ -228,21 +231,27 @@ class TestStoryFollowupGoals:
 
     @pytest.mark.asyncio
     async def test_should_accumulate_multiple_story_modifications(self):
-        infer_mock = _make_infer_mock([SHORT_STORY_CLAUSES, FOLLOWUP_SHORTER_CLAUSES, HUMOR_CLAUSES])
+        story_message = "Write a short story about space exploration for teenagers."
+        shorter_message = "Please make the story shorter."
+        humor_message = "Also add more humor to make it funnier."
+        infer_mock = _make_infer_mock({
+            story_message: SHORT_STORY_CLAUSES,
+            shorter_message: FOLLOWUP_SHORTER_CLAUSES,
+            humor_message: HUMOR_CLAUSES,
+        })
 
         with patch("backend.pipelines.goal_inference.call_llm_json", side_effect=infer_mock), \
              patch("backend.pipelines.goal_merge.call_llm_json", new_callable=AsyncMock) as merge_mock:
 
             merge_mock.side_effect = [MERGE_SHORTER_THEN_HUMOR, MERGE_FINAL_WITH_HUMOR]
 
-            initial_goals = await infer_goals(
-                "Write a short story about space exploration for teenagers.", "msg_1"
+            # Inferences are independent; the merges fold them in turn order
+            initial_goals, shorter_goals, humor_goals = await asyncio.gather(
+                infer_goals(story_message, "msg_1"),
+                infer_goals(shorter_message, "msg_2"),
+                infer_goals(humor_message, "msg_3"),
             )
-
-            shorter_goals = await infer_goals("Please make the story shorter.", "msg_2")
             merged_after_shorter = await merge_goals(initial_goals, shorter_goals)
-
-            humor_goals = await infer_goals("Also add more humor to make it funnier.", "msg_3")
             final_merged = await merge_goals(merged_after_shorter, humor_goals)
 
         final_texts = [goal.text.lower() for goal in final_merged]
@@ -16,8 +16,13 @@ from pathlib import Path
 backend_dir = Path(__file__).parent.parent.parent / "backend"
 sys.path.insert(0, str(backend_dir))
 
-from backend.models import Conversation, Message
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from backend.models import Conversation, Goal, Message
 from backend.repository import ConversationRepository
+from backend.connection_manager import encode_message
+from backend.api_endpoints import conversation_repository
+from backend.websocket_handlers import OFFLOAD_SERIALIZATION_MIN_MESSAGES, handle_get_conversation
 
 
 @pytest.mark.backend
@@ -66,26 +71,12 @@ class TestConversationContext:
         ]
         
         for msg in previous_messages:
-            conversations.get(conversation_id).messages.append(msg)
+            conversations.get(conversation_id).add_message(msg)
         
         # ACT: Build context as the LLM function would
         conversation = conversations.get(conversation_id)
-        messages_for_llm = []
-        
-        if conversation and conversation.messages:
-            # Include all previous messages for context
-            for msg in conversation.messages:
-                messages_for_llm.append({
-                    "role": msg.role,
-                    "content": msg.content
-                })
-        
-        # Add the current user message
         current_message = "What is the meaning of life according to the above story?"
-        messages_for_llm.append({
-            "role": "user", 
-            "content": current_message
-        })
+        messages_for_llm = conversation.llm_messages() + [{"role": "user", "content": current_message}]
         
         # ASSERT: The LLM context should include full conversation history
         assert len(messages_for_llm) == 5, f"Expected 5 messages in conversation history, got {len(messages_for_llm)}"
@@ -128,32 +119,44 @@ class TestConversationContext:
                 role=role,
                 timestamp=f"2024-01-01T10:0{i}:00"
             )
-            conversations.get(conversation_id).messages.append(msg)
+            conversations.get(conversation_id).add_message(msg)
         
         # ACT: Build context as would be done for LLM
         conversation = conversations.get(conversation_id)
-        messages_for_llm = []
-        
-        if conversation and conversation.messages:
-            # Include all previous messages for context
-            for msg in conversation.messages:
-                messages_for_llm.append({
-                    "role": msg.role,
-                    "content": msg.content
-                })
-        
-        # Add current message
+        prefix = conversation.llm_messages()
         current_message = "Third message"
-        messages_for_llm.append({
-            "role": "user", 
-            "content": current_message
-        })
+        messages_for_llm = prefix + [{"role": "user", "content": current_message}]
         
         # ASSERT: Verify order
         expected_contents = ["First message", "First response", "Second message", "Second response", "Third message"]
         actual_contents = [msg['content'] for msg in messages_for_llm]
         
         assert actual_contents == expected_contents, f"Message order incorrect. Expected: {expected_contents}, Got: {actual_contents}"
+
+        # Appending a turn extends the same view; earlier entries are untouched
+        conversation.add_message(Message(id="msg_4", content=current_message, role="user", timestamp="2024-01-01T10:04:00"))
+        extended = conversation.llm_messages()
+        assert extended is prefix
+        assert extended == messages_for_llm
+
+    def test_should_resync_llm_view_when_messages_change_outside_add_message(self):
+        """
+        GIVEN: A conversation whose LLM view has already been built
+        WHEN: Messages are appended directly, then the list is replaced
+        THEN: The view picks up the appended message and is rebuilt for the new list
+        """
+        conversation = Conversation(id="test_resync")
+        conversation.add_message(Message(id="msg_0", content="Hello", role="user", timestamp="t"))
+        conversation.llm_messages()
+
+        conversation.messages.append(Message(id="msg_1", content="Hi!", role="assistant", timestamp="t"))
+        assert conversation.llm_messages() == [
+            {"role": "user", "content": "Hello"},
+            {"role": "assistant", "content": "Hi!"},
+        ]
+
+        conversation.messages = [Message(id="msg_0", content="Restarted", role="user", timestamp="t")]
+        assert conversation.llm_messages() == [{"role": "user", "content": "Restarted"}]
     
     def test_should_maintain_conversation_history_in_storage(self):
         """
@@ -180,3 +183,77 @@ class TestConversationContext:
         assert stored_conversation.messages[1].content == "Hi there!"
         assert stored_conversation.messages[0].role == "user"
         assert stored_conversation.messages[1].role == "assistant"
+
+    @pytest.mark.asyncio
+    async def test_should_send_conversation_state_as_plain_json(self):
+        """
+        GIVEN: A stored conversation with messages and goals
+        WHEN: The client requests the conversation state over the WebSocket
+        THEN: The encoded frame should carry the same JSON as model_dump(mode="json")
+        """
+        conversation_id = "test_state_frame"
+        conversation = conversation_repository.create(conversation_id)
+        conversation.messages.append(Message(id="msg_0", content="Hello", role="user", timestamp="2024-01-01T10:00:00"))
+        conversation.add_goal(Goal(id="G0", text="Say hello", type="request", source_message_id="msg_0"))
+        manager = MagicMock()
+        manager.send_encoded = AsyncMock(return_value=True)
+
+        await handle_get_conversation(conversation_id, MagicMock(), manager)
+
+        frame = json.loads(manager.send_encoded.await_args.args[0])
+        state = frame["conversation"]
+        assert frame["type"] == "conversation_state"
+        assert state["messages"] == [conversation.messages[0].model_dump(mode="json")]
+        assert state["goals"] == [conversation.goals[0].model_dump(mode="json")]
+        assert state["pipeline_settings"] == {"infer": True, "merge": True, "evaluate": True}
+
+    @pytest.mark.asyncio
+    async def test_should_encode_long_conversation_state_off_the_event_loop(self):
+        """
+        GIVEN: A conversation long enough to cross the offload threshold
+        WHEN: The client requests the conversation state
+        THEN: The frame is encoded in a worker thread and still carries every message
+        """
+        conversation_id = "test_long_state_frame"
+        conversation = conversation_repository.create(conversation_id)
+        for index in range(OFFLOAD_SERIALIZATION_MIN_MESSAGES):
+            conversation.messages.append(Message(id=f"msg_{index}", content="Hello", role="user", timestamp="t"))
+        manager = MagicMock()
+        manager.send_encoded = AsyncMock(return_value=True)
+
+        with patch("backend.websocket_handlers.asyncio.to_thread", wraps=asyncio.to_thread) as to_thread:
+            await handle_get_conversation(conversation_id, MagicMock(), manager)
+
+        to_thread.assert_called_once()
+        frame = json.loads(manager.send_encoded.await_args.args[0])
+        assert len(frame["conversation"]["messages"]) == OFFLOAD_SERIALIZATION_MIN_MESSAGES
+
+    @pytest.mark.asyncio
+    async def test_should_encode_snapshot_taken_before_concurrent_goal_mutation(self):
+        """
+        GIVEN: A long conversation whose state is encoded in a worker thread
+        WHEN: A pipeline task changes a goal and a message while the frame is being encoded
+        THEN: The frame carries the state as it was when the request was handled
+        """
+        conversation_id = "test_state_frame_snapshot"
+        conversation = conversation_repository.create(conversation_id)
+        for index in range(OFFLOAD_SERIALIZATION_MIN_MESSAGES):
+            conversation.messages.append(Message(id=f"msg_{index}", content="Hello", role="user", timestamp="t"))
+        goal = conversation.add_goal(Goal(id="G0", text="Say hello", type="request", source_message_id="msg_0"))
+        manager = MagicMock()
+        manager.send_encoded = AsyncMock(return_value=True)
+
+        def mutate_then_encode(message):
+            goal.status = "ignored"
+            conversation.messages[0].goals.append(goal)
+            return encode_message(message)
+
+        try:
+            with patch("backend.websocket_handlers.encode_message", side_effect=mutate_then_encode):
+                await handle_get_conversation(conversation_id, MagicMock(), manager)
+        finally:
+            conversation_repository.delete(conversation_id)
+
+        state = json.loads(manager.send_encoded.await_args.args[0])["conversation"]
+        assert state["goals"][0]["status"] is None
+        assert state["messages"][0]["goals"] == []
@@ -0,0 +1,140 @@
+"""
+LLM Provider Connection Tests
+Tests pooled HTTP clients of the providers and how the registry releases them
+"""
+
+import asyncio
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import pytest
+
+import backend.llm_provider as llm_provider
+from backend.providers import LoopBoundClient
+from backend.providers.ollama_provider import OllamaProvider
+
+
+class _OllamaGenerateHandler(BaseHTTPRequestHandler):
+    """Answers /api/generate over HTTP/1.1 so the client keeps the connection alive"""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers["Content-Length"]))
+        body = json.dumps({"response": "ok"}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+    def finish(self):
+        super().finish()
+        self.server.closed_connections.release()
+
+
+@pytest.fixture
+def local_ollama(monkeypatch):
+    """Serve a minimal Ollama API on localhost and point OllamaProvider at it"""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _OllamaGenerateHandler)
+    server.closed_connections = threading.Semaphore(0)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    monkeypatch.setenv("OLLAMA_BASE_URL", f"http://127.0.0.1:{server.server_port}")
+    monkeypatch.setenv("OLLAMA_MAX_RETRIES", "1")
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.mark.backend
+class TestProviderConnections:
+    """Tests for pooled provider clients and their lifecycle"""
+
+    @pytest.mark.asyncio
+    async def test_should_reuse_one_pooled_client_across_ollama_calls(self):
+        """Test that the Ollama provider keeps one client for every call and closes it on shutdown"""
+        requests_seen = []
+
+        def respond(request):
+            requests_seen.append(request)
+            return httpx.Response(200, json={"response": "ok"})
+
+        provider = OllamaProvider()
+        provider._http = LoopBoundClient(transport=httpx.MockTransport(respond))
+        client = provider.client
+
+        assert await provider.generate("first") == "ok"
+        assert await provider.generate("second") == "ok"
+
+        assert provider.client is client
+        assert len(requests_seen) == 2
+        await provider.aclose()
+        assert client.is_closed
+
+    def test_should_serve_ollama_calls_from_separate_event_loops(self, local_ollama):
+        """Test that a cached provider does not reuse keep-alive connections from a closed loop"""
+        provider = OllamaProvider()
+
+        results = [asyncio.run(provider.generate("hi")) for _ in range(3)]
+
+        assert results == ["ok", "ok", "ok"]
+        # The clients of the two finished loops were released, not leaked
+        assert local_ollama.closed_connections.acquire(timeout=5)
+        assert local_ollama.closed_connections.acquire(timeout=5)
+
+    @pytest.mark.asyncio
+    async def test_should_close_pooled_provider_connections_on_shutdown(self):
+        """Test that closing the active provider releases its connections and drops the cached instance"""
+        provider = MagicMock()
+        provider.aclose = AsyncMock()
+
+        with patch.object(llm_provider, "_active_provider", provider):
+            await llm_provider.close_provider()
+
+            provider.aclose.assert_awaited_once()
+            assert llm_provider._active_provider is None
+
+    def test_should_close_pooled_client_when_provider_is_reset(self):
+        """Test that resetting the provider outside a loop closes the dropped provider's client"""
+        provider = MagicMock()
+        provider.aclose = AsyncMock()
+
+        with patch.object(llm_provider, "_active_provider", provider):
+            llm_provider.reset_provider()
+
+            provider.aclose.assert_awaited_once()
+            assert llm_provider._active_provider is None
+
+    @pytest.mark.asyncio
+    async def test_should_close_pooled_client_when_provider_is_reset_inside_a_loop(self):
+        """Test that resetting the provider on a running loop schedules the close on that loop"""
+        provider = OllamaProvider()
+        provider._http = LoopBoundClient(
+            transport=httpx.MockTransport(lambda request: httpx.Response(200, json={"response": "ok"}))
+        )
+        client = provider.client
+
+        with patch.object(llm_provider, "_active_provider", provider):
+            llm_provider.reset_provider()
+            await asyncio.gather(*llm_provider._closing_tasks)
+
+            assert client.is_closed
+            assert llm_provider._active_provider is None
+
+    def test_should_log_instead_of_raising_when_reset_close_fails(self, caplog):
+        """Test that a provider failing to close does not make reset_provider raise"""
+        provider = MagicMock()
+        provider.aclose = AsyncMock(side_effect=RuntimeError("Event loop is closed"))
+
+        with patch.object(llm_provider, "_active_provider", provider):
+            llm_provider.reset_provider()
+
+            assert llm_provider._active_provider is None
+        assert "Event loop is closed" in caplog.text
@@ -3,9 +3,12 @@ TDD Tests for Goal CRUD Operations
 Tests the manual goal management functionality as per TDD requirements (memory-only)
 """
 import pytest
-from datetime import datetime
 from backend.models import Goal, Conversation
 
+# The CRUD operations never read created_at, so every goal shares one constant
+FIXED_TS = "2024-01-01T10:00:00"
+
+
 class TestGoalCRUDOperations:
     """Test goal CRUD operations following TDD principles"""
 
@@ -30,7 +33,7 @@ class TestGoalCRUDOperations:
             text="Write a short story about dragons",
             type="request",
             source_message_id="msg_0",
-            created_at=datetime.now().isoformat()
+            created_at=FIXED_TS
         )
         conversation.goals.append(new_goal)
 
@@ -56,9 +59,9 @@ class TestGoalCRUDOperations:
             text="Original goal text",
             type="question",
             source_message_id="msg_1",
-            created_at=datetime.now().isoformat()
+            created_at=FIXED_TS
         )
-        conversation.goals.append(original_goal)
+        conversation.add_goal(original_goal)
 
         # WHEN
         original_goal.text = "Updated goal text"
@@ -68,7 +71,7 @@ class TestGoalCRUDOperations:
         original_goal.status = "confirmed"
 
         # THEN
-        updated_goal = conversation.goals[0]
+        updated_goal = conversation.get_goal_by_id("G1_manual")
         assert updated_goal.text == "Updated goal text"
         assert updated_goal.type == "request"
         assert updated_goal.locked == True
@@ -83,69 +86,49 @@ class TestGoalCRUDOperations:
         """
         # GIVEN
         conversation = sample_conversation
-        goal1 = Goal(id="G1", text="Goal 1", type="request", source_message_id="msg_1", created_at=datetime.now().isoformat())
-        goal2 = Goal(id="G2", text="Goal 2", type="question", source_message_id="msg_2", created_at=datetime.now().isoformat())
+        goal1 = Goal(id="G1", text="Goal 1", type="request", source_message_id="msg_1", created_at=FIXED_TS)
+        goal2 = Goal(id="G2", text="Goal 2", type="question", source_message_id="msg_2", created_at=FIXED_TS)
 
         conversation.goals.extend([goal1, goal2])
 
         # WHEN
-        conversation.goals = [g for g in conversation.goals if g.id != "G1"]
+        removed = conversation.remove_goal("G1")
 
         # THEN
+        assert removed is goal1
+        assert conversation.get_goal_by_id("G1") is None
         assert len(conversation.goals) == 1
         remaining_goal = conversation.goals[0]
         assert remaining_goal.id == "G2"
         assert remaining_goal.text == "Goal 2"
 
-    def test_should_lock_goal_to_prevent_automatic_updates(self, sample_conversation):
+    @pytest.mark.parametrize("initially_locked,lock", [
+        (False, True),
+        (True, False),
+    ], ids=["lock", "unlock"])
+    def test_should_toggle_goal_lock_for_automatic_updates(self, sample_conversation, initially_locked, lock):
         """
-        GIVEN: A goal exists in unlocked state
-        WHEN: Goal is locked via CRUD operation
-        THEN: Goal should have locked=True status
+        GIVEN: A goal exists in one lock state
+        WHEN: Goal is locked or unlocked via CRUD operation
+        THEN: Goal should report the new locked status
         """
         # GIVEN
         conversation = sample_conversation
         goal = Goal(
             id="G_lockable",
-            text="Goal to be locked",
+            text="Goal to be locked or unlocked",
             type="suggestion",
-            locked=False,
-            source_message_id="msg_1",
-            created_at=datetime.now().isoformat()
-        )
-        conversation.goals.append(goal)
-
-        # WHEN
-        goal.locked = True
-
-        # THEN
-        locked_goal = conversation.goals[0]
-        assert locked_goal.locked == True
-
-    def test_should_unlock_goal_to_allow_automatic_updates(self, sample_conversation):
-        """
-        GIVEN: A goal exists in locked state
-        WHEN: Goal is unlocked via CRUD operation
-        THEN: Goal should have locked=False status
-        """
-        # GIVEN
-        conversation = sample_conversation
-        goal = Goal(
-            id="G_unlockable",
-            text="Goal to be unlocked",
-            type="offer",
-            locked=True,
+            locked=initially_locked,
             source_message_id="msg_1",
-            created_at=datetime.now().isoformat()
+            created_at=FIXED_TS
         )
         conversation.goals.append(goal)
 
         # WHEN
-        goal.locked = False
+        goal.locked = lock
 
         # THEN
-        unlocked_goal = conversation.goals[0]
-        assert unlocked_goal.locked == False
+        assert conversation.goals[0].locked == lock
 
     def test_should_preserve_goal_creation_timestamp(self, sample_conversation):
         """
@@ -188,7 +171,7 @@ class TestGoalCRUDOperations:
                 text=f"A {goal_type} goal",
                 type=goal_type,
                 source_message_id=f"msg_{i}",
-                created_at=datetime.now().isoformat()
+                created_at=FIXED_TS
             )
             conversation.goals.append(goal)
 
@@ -197,4 +180,103 @@ class TestGoalCRUDOperations:
 
         retrieved_types = [goal.type for goal in conversation.goals]
         for goal_type in goal_types:
-            assert goal_type in retrieved_types
\ No newline at end of file
+            assert goal_type in retrieved_types
+
+    def test_should_resolve_goals_through_id_index(self, sample_conversation):
+        """
+        GIVEN: Goals added via add_goal and via direct list mutation
+        WHEN: Goals are looked up by ID
+        THEN: The id index should resolve both, including after reassignment
+        """
+        # GIVEN
+        conversation = sample_conversation
+        conversation.add_goal(Goal(id="G1", text="Goal 1", type="request", source_message_id="msg_1"))
+        conversation.goals.append(Goal(id="G2", text="Goal 2", type="question", source_message_id="msg_2"))
+
+        # THEN
+        assert conversation.get_goal_by_id("G1").text == "Goal 1"
+        assert conversation.get_goal_by_id("G2").text == "Goal 2"
+        assert conversation.get_goal_by_id("missing") is None
+
+        # WHEN - the goals list is replaced wholesale (as the merge pipeline does)
+        conversation.goals = [Goal(id="G3", text="Goal 3", type="offer", source_message_id="msg_3")]
+
+        # THEN
+        assert conversation.get_goal_by_id("G1") is None
+        assert conversation.get_goal_by_id("G3").text == "Goal 3"
+        assert set(conversation.model_dump()) == {"id", "messages", "goals", "alerts", "pipeline_settings", "goal_history"}
+
+    def test_should_remove_goal_by_id(self, sample_conversation):
+        """
+        GIVEN: Multiple goals exist in a conversation
+        WHEN: One goal is removed by ID
+        THEN: It should be gone from both the list and the index
+        """
+        # GIVEN
+        conversation = sample_conversation
+        conversation.add_goal(Goal(id="G1", text="Goal 1", type="request", source_message_id="msg_1"))
+        conversation.add_goal(Goal(id="G2", text="Goal 2", type="question", source_message_id="msg_2"))
+
+        # WHEN
+        removed = conversation.remove_goal("G1")
+
+        # THEN
+        assert removed.id == "G1"
+        assert [g.id for g in conversation.goals] == ["G2"]
+        assert conversation.get_goal_by_id("G1") is None
+        assert conversation.remove_goal("G1") is None
+
+    def test_should_keep_goal_order_and_index_in_sync_on_remove(self, sample_conversation):
+        """
+        GIVEN: Several goals, including two sharing an ID
+        WHEN: Goals are removed from the middle of the list
+        THEN: Order is preserved and lookups still resolve the remaining goals
+        """
+        # GIVEN
+        conversation = sample_conversation
+        for goal_id, text in [("G1", "One"), ("G2", "Two"), ("G3", "Three"), ("G2", "Two again"), ("G4", "Four")]:
+            conversation.add_goal(Goal(id=goal_id, text=text, type="request", source_message_id="msg_1"))
+
+        # WHEN
+        conversation.remove_goal("G2")
+
+        # THEN
+        assert [g.text for g in conversation.goals] == ["One", "Three", "Two again", "Four"]
+        assert conversation.get_goal_by_id("G2").text == "Two again"
+        assert conversation.get_goal_by_id("G4").text == "Four"
+
+        # WHEN - goals are reordered in place behind the index's back
+        conversation.goals.reverse()
+
+        # THEN
+        assert conversation.get_goal_by_id("G1").text == "One"
+        assert conversation.remove_goal("G3").text == "Three"
+        assert [g.id for g in conversation.goals] == ["G4", "G2", "G1"]
+
+    def test_should_resolve_goals_edited_in_place(self, sample_conversation):
+        """
+        GIVEN: An indexed goal list
+        WHEN: Goals are replaced or swapped in place without changing the list length
+        THEN: Lookups and removals should still find the current goals
+        """
+        # GIVEN
+        conversation = sample_conversation
+        for goal_id in ["A", "B"]:
+            conversation.add_goal(Goal(id=goal_id, text=goal_id, type="request", source_message_id="msg_1"))
+
+        # WHEN - a goal is replaced by index
+        conversation.goals[1] = Goal(id="C", text="C", type="request", source_message_id="msg_1")
+
+        # THEN
+        assert conversation.get_goal_by_id("C").text == "C"
+        assert conversation.get_goal_by_id("B") is None
+
+        # WHEN - one goal is appended and another popped, keeping the length
+        conversation.goals.append(Goal(id="X", text="X", type="request", source_message_id="msg_1"))
+        conversation.goals.pop(0)
+
+        # THEN
+        assert conversation.get_goal_by_id("A") is None
+        assert conversation.get_goal_by_id("X").text == "X"
+        assert conversation.remove_goal("X").text == "X"
+        assert [g.id for g in conversation.goals] == ["C"]
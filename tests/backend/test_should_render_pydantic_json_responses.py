@@ -0,0 +1,27 @@
+"""
+OnGoal JSON Response Tests
+Tests that API responses are rendered by the pydantic-core backed response class
+"""
+
+import json
+
+import pytest
+
+from backend.main import app
+from backend.models import Goal
+from backend.responses import PydanticJSONResponse
+
+
+@pytest.mark.backend
+class TestPydanticJSONResponse:
+    """Tests for the app-wide default JSON response class"""
+
+    def test_should_use_pydantic_json_response_by_default(self):
+        """Test that the app renders responses, including nested models, with pydantic-core"""
+        assert app.router.default_response_class is PydanticJSONResponse
+
+        goal = Goal(id="G1", text="Write a story", type="request", source_message_id="m1")
+        response = PydanticJSONResponse({"goals": [goal], "count": 1})
+
+        assert response.media_type == "application/json"
+        assert json.loads(response.body) == {"goals": [goal.model_dump(mode="json")], "count": 1}
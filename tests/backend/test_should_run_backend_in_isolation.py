@@ -139,16 +139,41 @@ class TestBackendIsolated:
         conversation = Conversation(id="pipeline_test")
 
         # Disable merge stage
-        conversation.pipeline_settings.merge = False
+        conversation.pipeline_settings = conversation.pipeline_settings.with_stage("merge", False)
         assert conversation.pipeline_settings.merge is False
         assert conversation.pipeline_settings.infer is True
         assert conversation.pipeline_settings.evaluate is True
 
         # Disable all stages
-        conversation.pipeline_settings.infer = False
-        conversation.pipeline_settings.merge = False
-        conversation.pipeline_settings.evaluate = False
+        for stage in ("infer", "merge", "evaluate"):
+            conversation.pipeline_settings = conversation.pipeline_settings.with_stage(stage, False)
 
         assert not conversation.pipeline_settings.infer
         assert not conversation.pipeline_settings.merge
         assert not conversation.pipeline_settings.evaluate
+
+    def test_pipeline_settings_toggle_does_not_leak_between_conversations(self):
+        """Test that the shared default settings are never mutated by a toggle"""
+        toggled = Conversation(id="toggled")
+        untouched = Conversation(id="untouched")
+        assert toggled.pipeline_settings is untouched.pipeline_settings
+
+        toggled.pipeline_settings = toggled.pipeline_settings.with_stage("infer", False)
+
+        assert toggled.pipeline_settings.infer is False
+        assert untouched.pipeline_settings.infer is True
+        with pytest.raises(ValueError):
+            untouched.pipeline_settings.infer = False
+        with pytest.raises(ValueError):
+            untouched.pipeline_settings.with_stage("unknown_stage", False)
+
+    def test_pipeline_settings_are_shared_per_flag_combination(self):
+        """Test that conversations toggled the same way share one settings instance"""
+        first = Conversation(id="first")
+        second = Conversation(id="second")
+
+        first.pipeline_settings = first.pipeline_settings.with_stage("evaluate", False)
+        second.pipeline_settings = second.pipeline_settings.with_stage("evaluate", False)
+
+        assert first.pipeline_settings is second.pipeline_settings
+        assert first.pipeline_settings.with_stage("evaluate", True) is Conversation(id="fresh").pipeline_settings
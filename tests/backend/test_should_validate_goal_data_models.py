@@ -14,7 +14,9 @@ from datetime import datetime
 backend_dir = Path(__file__).parent.parent / "backend"
 sys.path.insert(0, str(backend_dir))
 
-from backend.models import Goal
+from pydantic import ValidationError
+
+from backend.models import Goal, Message
 
 
 @pytest.mark.unit
@@ -117,3 +119,15 @@ class TestGoalDataModels:
         # Test JSON can be parsed back
         parsed_dict = json.loads(goal_json)
         assert parsed_dict["id"] == "G_serialize"
+
+    def test_should_keep_message_core_fields_write_once(self):
+        """Test Message id/content/role/timestamp are frozen while goals can still be attached"""
+        message = Message(id="msg_1", content="Write a story", role="user", timestamp="2025-09-19T10:00:00")
+        goal = Goal(id="G1", text="Write a story", type="request", source_message_id="msg_1")
+
+        message.goals = [goal]
+
+        assert message.goals == [goal]
+        for field, value in [("id", "msg_2"), ("content", "Edited"), ("role", "assistant"), ("timestamp", "later")]:
+            with pytest.raises(ValidationError):
+                setattr(message, field, value)
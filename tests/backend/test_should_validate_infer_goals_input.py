@@ -1,7 +1,14 @@
 import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
 from backend.pipelines.goal_inference import infer_goals
 
 
+def _provider_returning(response: str):
+    provider = MagicMock()
+    provider.generate = AsyncMock(return_value=response)
+    return provider
+
+
 class TestInferGoalsInputValidation:
     @pytest.mark.asyncio
     async def test_should_truncate_message_exceeding_max_length(self):
@@ -29,3 +36,35 @@ class TestInferGoalsInputValidation:
     async def test_should_reject_whitespace_only_message(self):
         with pytest.raises(ValueError, match="Message cannot be empty"):
             await infer_goals("   \n\t  ", "msg_1")
+
+    @pytest.mark.asyncio
+    async def test_should_build_goals_with_model_defaults(self):
+        response = '{"clauses": [{"clause": "Write a poem", "type": "request", "summary": "Write it"}]}'
+        with patch('backend.llm_provider.get_provider', return_value=_provider_returning(response)):
+            goals = await infer_goals("Write a poem", "msg_1", existing_goals_count=2)
+
+        assert [(g.id, g.text, g.type, g.source_message_id) for g in goals] == [("G2", "Write a poem", "request", "msg_1")]
+        assert goals[0].status is None and goals[0].locked is False and goals[0].evaluation is None
+
+    @pytest.mark.asyncio
+    async def test_should_reject_non_string_clause_fields_from_llm(self):
+        response = '{"clauses": [{"clause": ["Write a poem"], "type": "request"}]}'
+        provider = _provider_returning(response)
+        with patch('backend.llm_provider.get_provider', return_value=provider):
+            goals = await infer_goals("Write a poem", "msg_1")
+
+        assert goals == []
+        assert provider.generate.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_should_reuse_cached_inference_for_repeated_message(self):
+        response = '{"clauses": [{"clause": "Write a poem", "type": "request", "summary": "Write it"}]}'
+        provider = _provider_returning(response)
+        with patch('backend.llm_provider.get_provider', return_value=provider):
+            first = await infer_goals("Write a poem", "msg_1")
+            repeat = await infer_goals("  Write   a poem ", "msg_3", existing_goals_count=1)
+
+        assert provider.generate.await_count == 1
+        assert [(g.id, g.source_message_id) for g in first] == [("G0", "msg_1")]
+        assert [(g.id, g.text, g.source_message_id) for g in repeat] == [("G1", "Write a poem", "msg_3")]
+        assert repeat[0] is not first[0]
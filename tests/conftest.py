@@ -8,10 +8,20 @@ import asyncio
 import subprocess
 import time
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from pathlib import Path
 import os
 import signal
 
+import websockets
+from fastapi.testclient import TestClient
+from pydantic_core import from_json, to_json
+from backend.api_endpoints import conversation_repository
+from backend.main import app
+from backend.pipelines.goal_inference import clear_inference_cache
+from tests.utils.llm_verdict_cache import get_shared_verdict_cache
+
 
 class BackendTestServer:
     """Manages a single backend server for all tests"""
@@ -157,7 +167,6 @@ import os
 sys.path.insert(0, '{str(self.project_root)}')
 from run_frontend import main
 import http.server
-import socketserver
 from pathlib import Path
 
 # Override port
@@ -175,7 +184,7 @@ class NoCacheHTTPRequestHandler(http.server.SimpleHTTPRequestHandler):
         self.send_header('Expires', '0')
         super().end_headers()
 
-with socketserver.TCPServer((HOST, PORT), NoCacheHTTPRequestHandler) as httpd:
+with http.server.ThreadingHTTPServer((HOST, PORT), NoCacheHTTPRequestHandler) as httpd:
     httpd.serve_forever()
 """],
                 stdout=subprocess.PIPE,
@@ -254,12 +263,54 @@ def frontend_server():
     # Don't cleanup here - let the process handle it
 
 
+@pytest.fixture(scope="session", autouse=True)
+def llm_verdict_cache():
+    """Persist LLM judge verdicts across runs so unchanged assertions skip the judge call"""
+    cache = get_shared_verdict_cache()
+    yield cache
+    cache.save()
+
+
+WEBSOCKET_PROBE_MESSAGE = {"type": "user_message", "message": "What is the capital of France?"}
+
+
+async def _fetch_first_websocket_reply(uri, message, timeout=15.0):
+    """Bound connect, send and receive together so a hung handshake can't pin the run."""
+    try:
+        async with asyncio.timeout(timeout):
+            # Goal frames repeat the same keys, so ask for permessage-deflate explicitly;
+            # the probe is a single short round trip and needs no keepalive pings
+            async with websockets.connect(
+                uri, compression="deflate", max_size=2 ** 22, ping_interval=None, open_timeout=5
+            ) as websocket:
+                # Same Rust encoder/decoder the backend uses for its frames
+                await websocket.send(to_json(message).decode())
+                return from_json(await websocket.recv())
+    except TimeoutError:
+        return None
+
+
+@pytest.fixture(scope="session")
+def websocket_first_reply(backend_server):
+    """First frame the live backend sends for WEBSOCKET_PROBE_MESSAGE, or None on timeout.
+
+    The connect + inference round trip runs once per session; every test
+    asserting on the reply reuses it.
+    """
+    return asyncio.run(_fetch_first_websocket_reply("ws://localhost:8000/ws", WEBSOCKET_PROBE_MESSAGE))
+
+
 @pytest.fixture(autouse=True)
 def clean_state():
-    """Reset application state before each test"""
+    """Reset application state before each test; drop in-process conversations it created"""
     if _backend_server:
         _backend_server.reset_state()
+    clear_inference_cache()
+    existing_ids = set(conversation_repository.all_ids())
     yield
+    for conversation_id in conversation_repository.all_ids():
+        if conversation_id not in existing_ids:
+            conversation_repository.delete(conversation_id)
 
 
 @pytest.fixture
@@ -268,6 +319,23 @@ def backend_url(backend_server):
     return "http://localhost:8000"
 
 
+@pytest.fixture(scope="session")
+def api_client():
+    """In-process client for the FastAPI app: no server process, no TCP"""
+    with TestClient(app) as client:
+        yield client
+
+
+@pytest.fixture(scope="session")
+def http_session():
+    """Keep-alive HTTP session so REST tests against the live backend share pooled connections"""
+    session = requests.Session()
+    session.mount("http://", HTTPAdapter(pool_connections=4, pool_maxsize=4,
+                                         max_retries=Retry(total=2, backoff_factor=0.1)))
+    yield session
+    session.close()
+
+
 @pytest.fixture
 def frontend_url(frontend_server):
     """Frontend server URL"""
@@ -288,6 +356,20 @@ def pytest_addoption(parser):
         "--visible", action="store_true", default=False,
         help="Run browser tests in visible mode"
     )
+    parser.addoption(
+        "--run-integration", action="store_true", default=False,
+        help="Run integration tests that call a live LLM or backend"
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip live-LLM integration tests unless opted in or selected with -m"""
+    if config.getoption("--run-integration") or "integration" in (config.getoption("markexpr") or ""):
+        return
+    skip_integration = pytest.mark.skip(reason="live LLM test; pass --run-integration to run")
+    for item in items:
+        if "integration" in item.keywords:
+            item.add_marker(skip_integration)
 
 
 @pytest.fixture(scope="session")
@@ -0,0 +1,50 @@
+"""
+In-memory LLM provider for tests
+
+Installed as the active provider, so every pipeline stage that goes through
+backend.llm_provider sees it without patching individual call sites.
+"""
+
+from typing import AsyncGenerator, Dict, List, Optional
+
+from backend.providers import LLMProvider
+
+
+class FakeLLMProvider(LLMProvider):
+    """Returns a canned response, or raises a queued error on the next call"""
+
+    def __init__(self, response: str = ""):
+        self.response = response
+        self.available = True
+        self.prompts: List[str] = []
+        self._next_error: Optional[BaseException] = None
+
+    def set_response(self, response: str) -> None:
+        self.response = response
+
+    def raise_next(self, error: BaseException) -> None:
+        """Make the next generate/generate_stream call raise *error*."""
+        self._next_error = error
+
+    def _raise_pending_error(self) -> None:
+        error, self._next_error = self._next_error, None
+        if error is not None:
+            raise error
+
+    async def generate(self, prompt: str, max_tokens: int = 1000) -> str:
+        self.prompts.append(prompt)
+        self._raise_pending_error()
+        return self.response
+
+    async def generate_stream(
+        self, messages: List[Dict[str, str]], max_tokens: int = 2000
+    ) -> AsyncGenerator[str, None]:
+        self.prompts.append(messages[-1]["content"])
+        self._raise_pending_error()
+        yield self.response
+
+    def is_available(self) -> bool:
+        return self.available
+
+    def get_status(self) -> Dict[str, object]:
+        return {"provider": "fake", "model": "fake", "available": self.available, "cost": "free"}
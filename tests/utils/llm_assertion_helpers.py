@@ -5,14 +5,24 @@ Uses the configured LLM provider (Ollama/OpenRouter/Anthropic) to make
 intelligent assertions about goals and language instead of exact matching.
 """
 
+import asyncio
 import json
+import logging
 import os
-from typing import List, Dict
+from typing import List, Dict, Optional
 
 from dotenv import load_dotenv
 
+from tests.utils.llm_json_repair import parse_llm_json
+from tests.utils.llm_verdict_cache import VerdictCache, get_shared_verdict_cache
+
 load_dotenv()
 
+logger = logging.getLogger(__name__)
+
+# "semantic" asks the judge LLM; "fast" checks concepts by substring, no network
+LLM_ASSERT_MODE_ENV = "ONGOAL_LLM_ASSERT_MODE"
+
 
 class LLMAssertionResult:
     """Result of an LLM-based assertion"""
@@ -30,6 +40,9 @@ class LLMAssertionResult:
 class LLMAssertionHelper:
     """Helper class for LLM-based assertions using any provider"""
 
+    def __init__(self, verdict_cache: Optional[VerdictCache] = None):
+        self.verdict_cache = verdict_cache if verdict_cache is not None else get_shared_verdict_cache()
+
     async def _ask_llm(self, prompt: str, max_tokens: int = 512) -> str:
         """Send a prompt to the LLM and return the text response"""
         from backend.llm_provider import get_provider
@@ -37,13 +50,32 @@ class LLMAssertionHelper:
         provider = get_provider()
         return await provider.generate(prompt, max_tokens=max_tokens)
 
+    @staticmethod
+    def _format_goals(goals: List[Dict]) -> str:
+        return "\n".join(f"- [{g.get('type', 'unknown')}] {g.get('text', '')}" for g in goals)
+
+    @staticmethod
+    def _fast_mode() -> bool:
+        return os.getenv(LLM_ASSERT_MODE_ENV, "semantic").lower() == "fast"
+
+    @staticmethod
+    def _substring_match(goals: List[Dict], expected_concept: str) -> LLMAssertionResult:
+        concept = expected_concept.casefold()
+        return LLMAssertionResult(passed=any(concept in g.get("text", "").casefold() for g in goals),
+                                  reason="substring", confidence="low")
+
+    def _cache_key(self, prompt: str) -> str:
+        from backend.llm_provider import get_provider
+
+        return VerdictCache.key(getattr(get_provider(), "model", ""), prompt)
+
     async def assert_goal_semantic_match(
         self, goals: List[Dict], expected_concept: str, context: str = ""
     ) -> LLMAssertionResult:
         """Assert that goals contain a specific concept semantically"""
-        goals_text = "\n".join(
-            [f"- [{g.get('type', 'unknown')}] {g.get('text', '')}" for g in goals]
-        )
+        if self._fast_mode():
+            return self._substring_match(goals, expected_concept)
+        goals_text = self._format_goals(goals)
 
         prompt = f"""You are evaluating whether a list of goals contains a specific concept.
 
@@ -61,6 +93,67 @@ Respond ONLY with valid JSON:
 
         return await self._evaluate(prompt)
 
+    async def assert_goals_semantic_match_batch(
+        self, goals: List[Dict], expected_concepts: List[str], context: str = ""
+    ) -> List[LLMAssertionResult]:
+        """Judge several concepts against the same goals in one LLM call.
+
+        Falls back to concurrent per-concept assert_goal_semantic_match calls
+        when the batched reply can't be matched up with the concepts.
+        """
+        if self._fast_mode():
+            return [self._substring_match(goals, concept) for concept in expected_concepts]
+        concepts_text = "\n".join(f'{i}. "{c}"' for i, c in enumerate(expected_concepts, 1))
+        prompt = f"""You are evaluating whether a list of goals contains each of several concepts.
+
+CONTEXT: {context or "Testing goal extraction and merging in a conversational AI system."}
+
+GOALS TO EVALUATE:
+{self._format_goals(goals)}
+
+EXPECTED CONCEPTS:
+{concepts_text}
+
+TASK: For each expected concept, determine if any of the goals semantically captures it.
+
+Respond ONLY with valid JSON containing one result per concept, each echoing the concept's number as "id":
+{{"results": [{{"id": 1, "passed": true/false, "reason": "Brief explanation", "confidence": "high/medium/low"}}]}}"""
+
+        cache_key = self._cache_key(prompt)
+        cached = self.verdict_cache.get(cache_key)
+        if cached is None:
+            try:
+                response_text = await self._ask_llm(prompt, max_tokens=256 * len(expected_concepts))
+                results = json.loads(response_text.replace("```json", "").replace("```", "").strip())["results"]
+                cached = {"results": self._match_batch_results(results, len(expected_concepts))}
+            except Exception as e:
+                logger.warning("Batched judge reply rejected, judging concepts one by one: %s", e)
+                return list(await asyncio.gather(*(
+                    self.assert_goal_semantic_match(goals, concept, context) for concept in expected_concepts
+                )))
+            if all(verdict["passed"] for verdict in cached["results"]):
+                self.verdict_cache.put(cache_key, cached)
+        return [LLMAssertionResult(**verdict) for verdict in cached["results"]]
+
+    @staticmethod
+    def _match_batch_results(results: List[Dict], count: int) -> List[Dict]:
+        """Order batched verdicts by the concept id the judge echoed back.
+
+        Raises ValueError on an unknown, duplicate or missing id, so a reordered,
+        dropped or merged entry is never assigned to the wrong concept.
+        """
+        by_id: Dict[int, Dict] = {}
+        for result in results:
+            concept_id = result.get("id")
+            if type(concept_id) is not int or not 1 <= concept_id <= count or concept_id in by_id:
+                raise ValueError(f"unknown or duplicate concept id {concept_id!r}")
+            by_id[concept_id] = result
+        missing = [i for i in range(1, count + 1) if i not in by_id]
+        if missing:
+            raise ValueError(f"no verdict for concept ids {missing}")
+        return [{"passed": by_id[i].get("passed") is True, "reason": by_id[i].get("reason", "No reason provided"),
+                 "confidence": by_id[i].get("confidence", "unknown")} for i in range(1, count + 1)]
+
     async def assert_goal_preserved_through_merge(
         self,
         original_goals: List[Dict],
@@ -69,15 +162,9 @@ Respond ONLY with valid JSON:
         target_concept: str,
     ) -> LLMAssertionResult:
         """Assert that a concept is preserved through merge"""
-        original_text = "\n".join(
-            [f"- [{g.get('type', 'unknown')}] {g.get('text', '')}" for g in original_goals]
-        )
-        new_text = "\n".join(
-            [f"- [{g.get('type', 'unknown')}] {g.get('text', '')}" for g in new_goals]
-        )
-        merged_text = "\n".join(
-            [f"- [{g.get('type', 'unknown')}] {g.get('text', '')}" for g in merged_goals]
-        )
+        original_text = self._format_goals(original_goals)
+        new_text = self._format_goals(new_goals)
+        merged_text = self._format_goals(merged_goals)
 
         prompt = f"""You are evaluating a goal merging operation.
 
@@ -103,9 +190,7 @@ Respond ONLY with valid JSON:
         self, message: str, goals: List[Dict], expected_intents: List[str]
     ) -> LLMAssertionResult:
         """Assert that extracted goals capture intended meanings"""
-        goals_text = "\n".join(
-            [f"- [{g.get('type', 'unknown')}] {g.get('text', '')}" for g in goals]
-        )
+        goals_text = self._format_goals(goals)
         intents_text = "\n".join([f"- {i}" for i in expected_intents])
 
         prompt = f"""Evaluate whether extracted goals capture the expected intents.
@@ -129,6 +214,11 @@ Respond ONLY with valid JSON:
         """Send prompt to LLM and parse the JSON response, with retries for transient errors"""
         import httpx
 
+        cache_key = self._cache_key(prompt)
+        cached = self.verdict_cache.get(cache_key)
+        if cached is not None:
+            return LLMAssertionResult(**cached)
+
         for attempt in range(max_retries + 1):
             try:
                 response_text = await self._ask_llm(prompt)
@@ -143,15 +233,19 @@ Respond ONLY with valid JSON:
                     response_text = (
                         response_text.replace("```json", "").replace("```", "").strip()
                     )
-                result_data = self._parse_json_response(response_text)
-                return LLMAssertionResult(
-                    passed=result_data.get("passed", False),
-                    reason=result_data.get("reason", "No reason provided"),
-                    confidence=result_data.get("confidence", "unknown"),
-                )
+                result_data = parse_llm_json(response_text)
+                verdict = {
+                    "passed": result_data.get("passed") is True,
+                    "reason": result_data.get("reason", "No reason provided"),
+                    "confidence": result_data.get("confidence", "unknown"),
+                }
+                # Only explicit passes are cached; a failure may be a flaky judge
+                # call or a repaired reply without a verdict, so it is re-asked
+                if result_data.get("passed") is True:
+                    self.verdict_cache.put(cache_key, verdict)
+                return LLMAssertionResult(**verdict)
             except httpx.HTTPStatusError as e:
                 if attempt < max_retries and e.response.status_code in (429, 500, 502, 503, 504):
-                    import asyncio
                     await asyncio.sleep(2 ** attempt)
                     continue
                 return LLMAssertionResult(
@@ -161,63 +255,12 @@ Respond ONLY with valid JSON:
                 )
             except Exception as e:
                 if attempt < max_retries:
-                    import asyncio
                     await asyncio.sleep(2 ** attempt)
                     continue
                 return LLMAssertionResult(
                     passed=False, reason=f"LLM assertion failed: {e}", confidence="low"
                 )
 
-    @staticmethod
-    def _parse_json_response(text: str) -> dict:
-        """Parse JSON from LLM response, with repair for truncated output"""
-        import re
-
-        # Try direct parse first
-        try:
-            return json.loads(text)
-        except json.JSONDecodeError:
-            pass
-
-        # Strip trailing incomplete content and try to close the object
-        trimmed = text.rstrip()
-        # Remove trailing incomplete string/whitespace/comma
-        trimmed = re.sub(r'[,"]?\s*$', '', trimmed)
-        if not trimmed.endswith("}"):
-            trimmed += "}"
-
-        try:
-            return json.loads(trimmed)
-        except json.JSONDecodeError:
-            pass
-
-        # Last resort: extract all valid key-value pairs and rebuild
-        kv_pairs = re.findall(
-            r'"(passed|reason|confidence)"\s*:\s*"(?:[^"\\]|\\.)*"|'
-            r'"(passed|reason|confidence)"\s*:\s*(?:true|false|\d+)',
-            trimmed,
-        )
-        if kv_pairs:
-            # Flatten the tuples from findall groups
-            pairs = []
-            for match in kv_pairs:
-                pairs.append(match[0] or match[1])
-            # Just parse what we can from each match
-            all_pairs = re.findall(
-                r'"(passed|reason|confidence)"\s*:\s*(?:"((?:[^"\\]|\\.)*)"|(true|false|\d+))',
-                trimmed,
-            )
-            parts = []
-            for key, str_val, bare_val in all_pairs:
-                if str_val:
-                    parts.append(f'"{key}": "{str_val}"')
-                else:
-                    parts.append(f'"{key}": {bare_val}')
-            rebuilt = "{" + ", ".join(parts) + "}"
-            return json.loads(rebuilt)
-
-        raise json.JSONDecodeError("Could not parse LLM JSON response", text, 0)
-
 
 # Lazy global instance — created on first access, not at import time
 llm_assert = None
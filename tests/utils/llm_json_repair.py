@@ -0,0 +1,53 @@
+"""
+JSON repair for LLM judge replies
+
+Judge models sometimes truncate their JSON; parse_llm_json recovers the
+verdict fields when a plain json.loads fails.
+"""
+
+import json
+import re
+
+
+def parse_llm_json(text: str) -> dict:
+    """Parse JSON from LLM response, with repair for truncated output"""
+    # Try direct parse first
+    try:
+        return json.loads(text)
+    except json.JSONDecodeError:
+        pass
+
+    # Strip trailing incomplete content and try to close the object
+    trimmed = text.rstrip()
+    # Remove trailing incomplete string/whitespace/comma
+    trimmed = re.sub(r'[,"]?\s*$', '', trimmed)
+    if not trimmed.endswith("}"):
+        trimmed += "}"
+
+    try:
+        return json.loads(trimmed)
+    except json.JSONDecodeError:
+        pass
+
+    # Last resort: extract all valid key-value pairs and rebuild
+    kv_pairs = re.findall(
+        r'"(passed|reason|confidence)"\s*:\s*"(?:[^"\\]|\\.)*"|'
+        r'"(passed|reason|confidence)"\s*:\s*(?:true|false|\d+)',
+        trimmed,
+    )
+    if kv_pairs:
+        # Just parse what we can from each match
+        all_pairs = re.findall(
+            r'"(passed|reason|confidence)"\s*:\s*(?:"((?:[^"\\]|\\.)*)"|(true|false|\d+))',
+            trimmed,
+        )
+        parts = []
+        for key, str_val, bare_val in all_pairs:
+            if str_val:
+                parts.append(f'"{key}": "{str_val}"')
+            else:
+                parts.append(f'"{key}": {bare_val}')
+        rebuilt = "{" + ", ".join(parts) + "}"
+        return json.loads(rebuilt)
+
+    raise json.JSONDecodeError("Could not parse LLM JSON response", text, 0)
@@ -0,0 +1,80 @@
+"""
+Verdict cache for LLM-based assertions
+
+Judge prompts are built deterministically from the goals under test, so the
+same prompt sent to the same model asks the same question. Verdicts are
+memoized per (model, prompt) and persisted under .pytest_cache so reruns skip
+judge calls whose inputs have not changed.
+"""
+
+import hashlib
+import json
+import time
+from pathlib import Path
+from typing import Dict, Optional
+
+# Long enough to cover a day of reruns, short enough that a changed model
+# behind the same name is eventually re-asked
+VERDICT_TTL_SECONDS = 24 * 60 * 60
+DEFAULT_CACHE_PATH = Path(__file__).resolve().parents[2] / ".pytest_cache" / "llm_assert" / "verdicts.json"
+
+
+class VerdictCache:
+    """Hash-keyed store of parsed judge verdicts with an optional JSON file behind it"""
+
+    def __init__(self, path: Optional[Path] = None, ttl_seconds: float = VERDICT_TTL_SECONDS):
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self._entries: Dict[str, dict] = {}
+        self._dirty = False
+        self.load()
+
+    @staticmethod
+    def key(model: str, prompt: str) -> str:
+        # Whitespace never changes a judge's verdict, so assertions differing
+        # only in spacing share one entry; case is kept, since a proper noun or
+        # acronym check can hinge on it
+        canonical = " ".join(prompt.split())
+        return hashlib.blake2b(f"{model}\0{canonical}".encode(), digest_size=16).hexdigest()
+
+    def get(self, key: str) -> Optional[dict]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if time.time() - entry["stored_at"] > self.ttl_seconds:
+            del self._entries[key]
+            self._dirty = True
+            return None
+        return entry["verdict"]
+
+    def put(self, key: str, verdict: dict) -> None:
+        self._entries[key] = {"verdict": verdict, "stored_at": time.time()}
+        self._dirty = True
+
+    def load(self) -> None:
+        """Read persisted verdicts; a missing or corrupt file starts an empty cache."""
+        if self.path is None or not self.path.exists():
+            return
+        try:
+            self._entries = json.loads(self.path.read_text())
+        except (OSError, ValueError):
+            self._entries = {}
+
+    def save(self) -> None:
+        """Write verdicts back to disk if anything changed this session."""
+        if self.path is None or not self._dirty:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.write_text(json.dumps(self._entries))
+        self._dirty = False
+
+
+_shared_cache: Optional[VerdictCache] = None
+
+
+def get_shared_verdict_cache() -> VerdictCache:
+    """Session-wide cache backed by DEFAULT_CACHE_PATH, created on first use."""
+    global _shared_cache
+    if _shared_cache is None:
+        _shared_cache = VerdictCache(DEFAULT_CACHE_PATH)
+    return _shared_cache